@@ -397,6 +397,23 @@ class InfuraClient(Web3Client):
 class EthereumTesterClient(Web3Client):
 
     is_local = True
+    _accounts_cache = None
+
+    @property
+    def accounts(self):
+        # The testing backend holds a static account set within a process,
+        # so skip the eth_accounts RPC round-trip on repeated access
+        if self._accounts_cache is None:
+            self._accounts_cache = self.w3.eth.accounts
+        return self._accounts_cache
+
+    def wait_for_receipt(self, transaction_hash: str, timeout: int) -> dict:
+        # The tester backend mines synchronously, so the receipt
+        # is already available and there is no need to poll for it
+        receipt = self.w3.eth.waitForTransactionReceipt(transaction_hash=transaction_hash,
+                                                        timeout=timeout,
+                                                        poll_latency=0)
+        return receipt
 
     def unlock_account(self, address, password, duration: int = None) -> bool:
         """Returns True if the testing backend keyring has control of the given address."""
@@ -424,6 +441,7 @@ class EthereumTesterClient(Web3Client):
     def new_account(self, password: str) -> str:
         insecure_account = self.w3.provider.ethereum_tester.add_account(private_key=os.urandom(32).hex(),
                                                                         password=password)
+        self._accounts_cache = None  # Invalidate the account cache
         return insecure_account
 
     def sign_transaction(self, transaction: dict) -> bytes:
@@ -556,6 +556,7 @@ class BlockchainDeployerInterface(BlockchainInterface):
         else:
             __raw_contract_cache = NO_COMPILATION_PERFORMED
         self.__raw_contract_cache = __raw_contract_cache
+        self.__contract_factory_cache = dict()
 
     @validate_checksum_address
     def deploy_contract(self,
@@ -633,9 +634,14 @@ class BlockchainDeployerInterface(BlockchainInterface):
                 raise self.InterfaceError(message)
             raise
         else:
-            contract = self.client.w3.eth.contract(abi=interface['abi'],
-                                                   bytecode=interface['bin'],
-                                                   ContractFactoryClass=Contract)
+            # Compiled interfaces are static, so build each factory only once
+            try:
+                contract = self.__contract_factory_cache[contract_name]
+            except KeyError:
+                contract = self.client.w3.eth.contract(abi=interface['abi'],
+                                                       bytecode=interface['bin'],
+                                                       ContractFactoryClass=Contract)
+                self.__contract_factory_cache[contract_name] = contract
             return contract
 
     def _wrap_contract(self, wrapper_contract: Contract, target_contract: Contract) -> Contract:
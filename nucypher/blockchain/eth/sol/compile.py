@@ -62,6 +62,9 @@ class SolidityCompiler:
         self.source_dir = source_dir if source_dir is not None else self.__default_contract_dir
         self._test_solidity_source_dir = test_contract_dir
 
+        # Memoized compiler output; source files do not change within a process
+        self._compiled_interfaces = None
+
         # JSON config
         self.__configuration_path = configuration_path if configuration_path is not None else self.__default_configuration_path
         self._chain_name = chain_name if chain_name is not None else self.__default_chain_name
@@ -80,6 +83,10 @@ class SolidityCompiler:
     def compile(self) -> dict:
         """Executes the compiler with parameters specified in the json config"""
 
+        if self._compiled_interfaces is not None:
+            self.log.debug("Reusing memoized compiler output for {}".format(self.source_dir))
+            return self._compiled_interfaces
+
         self.log.info("Using solidity compiler binary at {}".format(self.__sol_binary_path))
         self.log.info("Compiling solidity source files at {}".format(self.source_dir))
 
@@ -128,4 +135,5 @@ class SolidityCompiler:
 
         # Cleanup the compiled data keys
         interfaces = {name.split(':')[-1]: compiled_sol[name] for name in compiled_sol}
+        self._compiled_interfaces = interfaces
         return interfaces
@@ -17,6 +17,7 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 
 
 import os
+from contextlib import contextmanager
 from typing import List, Tuple
 
 import maya
@@ -70,7 +71,7 @@ class TesterBlockchain(BlockchainDeployerInterface):
     _PROVIDER_URI = 'tester://pyevm'
     TEST_CONTRACTS_DIR = os.path.join(BASE_DIR, 'tests', 'blockchain', 'eth', 'contracts', 'contracts')
     _compiler = SolidityCompiler(test_contract_dir=TEST_CONTRACTS_DIR)
-    _test_account_cache = list()
+    _test_account_cache = list()  # Insecure private keys, shared by all instances in the process
 
     _default_test_accounts = NUMBER_OF_ETH_TEST_ACCOUNTS
 
@@ -146,27 +147,52 @@ class TesterBlockchain(BlockchainDeployerInterface):
             raise RuntimeError("WARNING: Parity providers are not implemented.")
 
         addresses = list()
-        for _ in range(quantity):
-            address = self.provider.ethereum_tester.add_account('0x' + os.urandom(32).hex())
+        for index in range(quantity):
+            # Reuse keys cached by a previous instance to avoid repeating key generation
+            try:
+                insecure_key = self._test_account_cache[index]
+            except IndexError:
+                insecure_key = '0x' + os.urandom(32).hex()
+                self._test_account_cache.append(insecure_key)
+            address = self.provider.ethereum_tester.add_account(insecure_key)
             addresses.append(address)
-            self._test_account_cache.append(address)
             self.log.info('Generated new insecure account {}'.format(address))
+        self.client._accounts_cache = None  # Accounts were added behind the client's back
         return addresses
 
+    @contextmanager
+    def manual_mining(self):
+        """
+        Suspend auto-mining for the duration of the block so that all
+        transactions sent inside it are mined together on exit.
+        """
+        tester = self.provider.ethereum_tester
+        tester.disable_auto_mine_transactions()
+        try:
+            yield
+        finally:
+            # Re-enabling auto-mining also mines the pending transactions
+            tester.enable_auto_mine_transactions()
+
     def ether_airdrop(self, amount: int) -> List[str]:
         """Airdrops ether from creator address to all other addresses!"""
 
         coinbase, *addresses = self.w3.eth.accounts
 
         tx_hashes = list()
-        for address in addresses:
-            tx = {'to': address, 'from': coinbase, 'value': amount}
-            txhash = self.w3.eth.sendTransaction(tx)
+        with self.manual_mining():  # Single block for the whole airdrop
+            for address in addresses:
+                tx = {'to': address, 'from': coinbase, 'value': amount}
+                txhash = self.w3.eth.sendTransaction(tx)
+
+                tx_hashes.append(txhash)
+                eth_amount = Web3().fromWei(amount, 'ether')
+                self.log.info("Airdropped {} ETH {} -> {}".format(eth_amount, tx['from'], tx['to']))
 
-            _receipt = self.wait_for_receipt(txhash)
-            tx_hashes.append(txhash)
-            eth_amount = Web3().fromWei(amount, 'ether')
-            self.log.info("Airdropped {} ETH {} -> {}".format(eth_amount, tx['from'], tx['to']))
+        # All transactions were mined in one block on exiting the context;
+        # checking the last receipt is enough to confirm the batch landed.
+        if tx_hashes:
+            _receipt = self.wait_for_receipt(tx_hashes[-1])
 
         return tx_hashes
 
@@ -192,11 +218,13 @@ class TesterBlockchain(BlockchainDeployerInterface):
         else:
             raise ValueError("Specify either hours, seconds, or periods.")
 
-        now = self.w3.eth.getBlock(block_identifier='latest').timestamp
+        # Read the timestamp straight from the backend to skip the full
+        # block fetch and formatting that w3.eth.getBlock performs
+        now = self.provider.ethereum_tester.get_block_by_number('latest')['timestamp']
         end_timestamp = ((now+duration)//base) * base
 
-        self.w3.eth.web3.testing.timeTravel(timestamp=end_timestamp)
-        self.w3.eth.web3.testing.mine(1)
+        self.w3.testing.timeTravel(timestamp=end_timestamp)
+        self.w3.testing.mine(1)
 
         delta = maya.timedelta(seconds=end_timestamp-now)
         self.log.info(f"Time traveled {delta} "
@@ -267,7 +295,9 @@ class TesterBlockchain(BlockchainDeployerInterface):
     def wait_for_receipt(self, txhash: bytes, timeout: int = None) -> dict:
         """Wait for a transaction receipt and return it"""
         timeout = timeout or self.TIMEOUT
-        result = self.w3.eth.waitForTransactionReceipt(txhash, timeout=timeout)
+        # eth-tester mines synchronously, so the receipt is available on the
+        # first poll; a zero poll latency avoids web3's default 100ms sleep.
+        result = self.w3.eth.waitForTransactionReceipt(txhash, timeout=timeout, poll_latency=0)
         if result.status == 0:
             raise TransactionFailed()
         return result
@@ -28,7 +28,7 @@ INITIAL_SUPPLY = 10 ** 26
 TOTAL_SUPPLY = 2 * 10 ** 36
 
 
-@pytest.fixture()
+@pytest.fixture(scope='module')
 def token(testerchain, deploy_contract):
     # Create an ERC20 token
     token, _ = deploy_contract('NuCypherToken', _totalSupply=TOTAL_SUPPLY)
@@ -167,32 +167,36 @@ def test_inflation_rate(testerchain, token, deploy_contract):
     # Mint more tokens in the same period, inflation rate must be the same as in previous minting
     tx = issuer.functions.testMint(period + 1, 1, 1, 0).transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
-    assert 2 * one_period == token.functions.balanceOf(ursula).call()
-    assert reward - token.functions.balanceOf(ursula).call() == issuer.functions.getReservedReward().call()
+    balance = token.functions.balanceOf(ursula).call()
+    assert 2 * one_period == balance
+    assert reward - balance == issuer.functions.getReservedReward().call()
 
     # Mint tokens in the next period, inflation rate must be lower than in previous minting
     tx = issuer.functions.testMint(period + 2, 1, 1, 0).transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
-    assert 3 * one_period > token.functions.balanceOf(ursula).call()
-    assert reward - token.functions.balanceOf(ursula).call() == issuer.functions.getReservedReward().call()
-    minted_amount = token.functions.balanceOf(ursula).call() - 2 * one_period
+    balance = token.functions.balanceOf(ursula).call()
+    assert 3 * one_period > balance
+    assert reward - balance == issuer.functions.getReservedReward().call()
+    minted_amount = balance - 2 * one_period
 
     # Mint tokens in the first period again, inflation rate must be the same as in previous minting
     # but can't be equals as in first minting because rate can't be increased
     tx = issuer.functions.testMint(period + 1, 1, 1, 0).transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
-    assert 2 * one_period + 2 * minted_amount == token.functions.balanceOf(ursula).call()
-    assert reward - token.functions.balanceOf(ursula).call() == issuer.functions.getReservedReward().call()
+    balance = token.functions.balanceOf(ursula).call()
+    assert 2 * one_period + 2 * minted_amount == balance
+    assert reward - balance == issuer.functions.getReservedReward().call()
 
     # Mint tokens in the next period, inflation rate must be lower than in previous minting
     tx = issuer.functions.testMint(period + 3, 1, 1, 0).transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
-    assert 2 * one_period + 3 * minted_amount > token.functions.balanceOf(ursula).call()
-    assert reward - token.functions.balanceOf(ursula).call() == issuer.functions.getReservedReward().call()
+    balance = token.functions.balanceOf(ursula).call()
+    assert 2 * one_period + 3 * minted_amount > balance
+    reserved_reward = issuer.functions.getReservedReward().call()
+    assert reward - balance == reserved_reward
 
     # Return some tokens as a reward
-    balance = token.functions.balanceOf(ursula).call()
-    reward = issuer.functions.getReservedReward().call()
+    reward = reserved_reward
     tx = issuer.functions.testUnMint(2 * one_period + 2 * minted_amount).transact()
     testerchain.wait_for_receipt(tx)
     assert reward + 2 * one_period + 2 * minted_amount == issuer.functions.getReservedReward().call()
@@ -0,0 +1,29 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def chain_snapshot(testerchain):
+    # Contracts are deployed by module-scoped fixtures only once per module;
+    # roll the chain back after each test to undo in-test state changes
+    tester = testerchain.provider.ethereum_tester
+    snapshot_id = tester.take_snapshot()
+    yield
+    tester.revert_to_snapshot(snapshot_id)
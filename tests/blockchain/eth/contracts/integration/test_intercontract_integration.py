@@ -42,7 +42,7 @@ router_secret = os.urandom(SECRET_LENGTH)
 adjudicator_secret = os.urandom(SECRET_LENGTH)
 
 
-@pytest.fixture()
+@pytest.fixture(scope='module')
 def token_economics():
     economics = TokenEconomics(initial_supply=10 ** 9,
                                total_supply=2 * 10 ** 9,
@@ -429,12 +429,12 @@ def test_all(testerchain,
     testerchain.wait_for_receipt(tx)
     assert 10000 == token.functions.balanceOf(preallocation_escrow_1.address).call()
     assert ursula3 == preallocation_escrow_1.functions.owner().call()
-    assert 10000 >= preallocation_escrow_1.functions.getLockedTokens().call()
-    assert 9500 <= preallocation_escrow_1.functions.getLockedTokens().call()
+    locked_tokens = preallocation_escrow_1.functions.getLockedTokens().call()
+    assert 9500 <= locked_tokens <= 10000
     assert 10000 == token.functions.balanceOf(preallocation_escrow_2.address).call()
     assert ursula4 == preallocation_escrow_2.functions.owner().call()
-    assert 10000 >= preallocation_escrow_2.functions.getLockedTokens().call()
-    assert 9500 <= preallocation_escrow_2.functions.getLockedTokens().call()
+    locked_tokens = preallocation_escrow_2.functions.getLockedTokens().call()
+    assert 9500 <= locked_tokens <= 10000
 
     # Ursula's withdrawal attempt won't succeed because nothing to withdraw
     with pytest.raises((TransactionFailed, ValueError)):
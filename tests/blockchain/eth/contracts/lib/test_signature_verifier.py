@@ -37,8 +37,9 @@ ALGORITHM_SHA256 = 1
 ALGORITHM_RIPEMD160 = 2
 
 
-@pytest.fixture()
+@pytest.fixture(scope='module')
 def signature_verifier(testerchain, deploy_contract):
+    # The mock is stateless, so one deployment serves the whole module
     contract, _ = deploy_contract('SignatureVerifierMock')
     return contract
 
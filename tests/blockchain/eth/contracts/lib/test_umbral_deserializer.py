@@ -25,8 +25,9 @@ from umbral import pre, keys
 from umbral.signing import Signer
 
 
-@pytest.fixture()
+@pytest.fixture(scope='module')
 def deserializer(testerchain, deploy_contract):
+    # The mock is stateless, so one deployment serves the whole module
     contract, _ = deploy_contract('UmbralDeserializerMock')
     return contract
 
@@ -21,18 +21,17 @@ import pytest
 from web3.contract import Contract
 
 from nucypher.blockchain.eth.deployers import DispatcherDeployer
-from nucypher.crypto.powers import TransactingPower
 from nucypher.utilities.sandbox.constants import INSECURE_DEVELOPMENT_PASSWORD
 
 
-@pytest.fixture()
+@pytest.fixture(scope='module')
 def escrow(testerchain, deploy_contract, mock_transacting_power_activation):
     mock_transacting_power_activation(account=testerchain.etherbase_account, password=INSECURE_DEVELOPMENT_PASSWORD)
     escrow, _ = deploy_contract('StakingEscrowForAdjudicatorMock')
     return escrow
 
 
-@pytest.fixture(params=[False, True])
+@pytest.fixture(scope='module', params=[False, True])
 def adjudicator(testerchain, escrow, request, token_economics, deploy_contract):
     contract, _ = deploy_contract(
         'Adjudicator',
@@ -51,3 +50,4 @@ def adjudicator(testerchain, escrow, request, token_economics, deploy_contract):
             ContractFactoryClass=Contract)
 
     return contract
+
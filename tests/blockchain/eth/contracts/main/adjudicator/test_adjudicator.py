@@ -196,7 +196,6 @@ def test_evaluate_cfrag(testerchain,
     worker_stake = escrow.functions.getAllTokens(staker).call()
     investigator_balance = escrow.functions.rewardInfo(investigator).call()
 
-    assert not adjudicator.functions.evaluatedCFrags(data_hash).call()
     tx = adjudicator.functions.evaluateCFrag(*args).transact({'from': investigator})
     testerchain.wait_for_receipt(tx)
     number_of_evaluations += 1
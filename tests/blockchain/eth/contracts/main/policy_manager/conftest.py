@@ -24,14 +24,14 @@ from eth_utils import keccak
 secret = (123456).to_bytes(32, byteorder='big')
 
 
-@pytest.fixture()
+@pytest.fixture(scope='module')
 def escrow(testerchain, deploy_contract):
     # Creator deploys the escrow
     escrow, _ = deploy_contract('StakingEscrowForPolicyMock', 1)
     return escrow
 
 
-@pytest.fixture(params=[False, True])
+@pytest.fixture(scope='module', params=[False, True])
 def policy_manager(testerchain, escrow, request, deploy_contract):
     creator, client, bad_node, node1, node2, node3, *everyone_else = testerchain.client.accounts
 
@@ -68,3 +68,4 @@ def policy_manager(testerchain, escrow, request, deploy_contract):
     testerchain.wait_for_receipt(tx)
 
     return contract
+
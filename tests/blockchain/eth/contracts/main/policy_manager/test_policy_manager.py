@@ -69,19 +69,14 @@ def test_create_revoke(testerchain, escrow, policy_manager):
     assert 0 == policy_manager.functions.nodes(bad_node).call()[LAST_MINED_PERIOD_FIELD]
 
     # Try to create policy for bad (unregistered) node
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = policy_manager.functions.createPolicy(policy_id, 1, 0, [bad_node])\
-            .transact({'from': client, 'value': value})
-        testerchain.wait_for_receipt(tx)
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = policy_manager.functions.createPolicy(policy_id, 1, 0, [node1, bad_node])\
-            .transact({'from': client, 'value': value})
-        testerchain.wait_for_receipt(tx)
+    with pytest.raises(TransactionFailed):
+        policy_manager.functions.createPolicy(policy_id, 1, 0, [bad_node]).call({'from': client, 'value': value})
+    with pytest.raises(TransactionFailed):
+        policy_manager.functions.createPolicy(policy_id, 1, 0, [node1, bad_node]).call({'from': client, 'value': value})
 
     # Try to create policy with no ETH
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = policy_manager.functions.createPolicy(policy_id, 1, 0, [node1]).transact({'from': client})
-        testerchain.wait_for_receipt(tx)
+    with pytest.raises(TransactionFailed):
+        policy_manager.functions.createPolicy(policy_id, 1, 0, [node1]).call({'from': client})
 
     # Create policy
     period = escrow.functions.getCurrentPeriod().call()
@@ -108,15 +103,13 @@ def test_create_revoke(testerchain, escrow, policy_manager):
     assert client == event_args['client']
 
     # Can't create policy with the same id
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = policy_manager.functions.createPolicy(policy_id, number_of_periods, 0, [node1])\
-            .transact({'from': client, 'value': value})
-        testerchain.wait_for_receipt(tx)
+    with pytest.raises(TransactionFailed):
+        policy_manager.functions.createPolicy(policy_id, number_of_periods, 0, [node1]) \
+            .call({'from': client, 'value': value})
 
     # Only policy owner can revoke policy
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = policy_manager.functions.revokePolicy(policy_id).transact({'from': creator})
-        testerchain.wait_for_receipt(tx)
+    with pytest.raises(TransactionFailed):
+        policy_manager.functions.revokePolicy(policy_id).call({'from': creator})
     tx = policy_manager.functions.revokePolicy(policy_id).transact({'from': client, 'gas_price': 0})
     testerchain.wait_for_receipt(tx)
     assert policy_manager.functions.policies(policy_id).call()[DISABLED_FIELD]
@@ -137,12 +130,10 @@ def test_create_revoke(testerchain, escrow, policy_manager):
     assert value == event_args['value']
 
     # Can't revoke again because policy and all arrangements are disabled
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = policy_manager.functions.revokePolicy(policy_id).transact({'from': client})
-        testerchain.wait_for_receipt(tx)
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = policy_manager.functions.revokeArrangement(policy_id, node1).transact({'from': client})
-        testerchain.wait_for_receipt(tx)
+    with pytest.raises(TransactionFailed):
+        policy_manager.functions.revokePolicy(policy_id).call({'from': client})
+    with pytest.raises(TransactionFailed):
+        policy_manager.functions.revokeArrangement(policy_id, node1).call({'from': client})
 
     # Create new policy
     period = escrow.functions.getCurrentPeriod().call()
@@ -166,14 +157,11 @@ def test_create_revoke(testerchain, escrow, policy_manager):
     assert client == event_args['client']
 
     # Can't revoke nonexistent arrangement
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = policy_manager.functions.revokeArrangement(policy_id_2, testerchain.client.accounts[6])\
-            .transact({'from': client})
-        testerchain.wait_for_receipt(tx)
+    with pytest.raises(TransactionFailed):
+        policy_manager.functions.revokeArrangement(policy_id_2, testerchain.client.accounts[6]).call({'from': client})
     # Can't revoke null arrangement (also it's nonexistent)
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = policy_manager.functions.revokeArrangement(policy_id_2, BlockchainInterface.NULL_ADDRESS).transact({'from': client})
-        testerchain.wait_for_receipt(tx)
+    with pytest.raises(TransactionFailed):
+        policy_manager.functions.revokeArrangement(policy_id_2, BlockchainInterface.NULL_ADDRESS).call({'from': client})
 
     # Revoke only one arrangement
     tx = policy_manager.functions.revokeArrangement(policy_id_2, node1).transact({'from': client, 'gas_price': 0})
@@ -191,13 +179,11 @@ def test_create_revoke(testerchain, escrow, policy_manager):
     assert 2 * value == event_args['value']
 
     # Can't revoke again because arrangement is disabled
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = policy_manager.functions.revokeArrangement(policy_id_2, node1).transact({'from': client})
-        testerchain.wait_for_receipt(tx)
+    with pytest.raises(TransactionFailed):
+        policy_manager.functions.revokeArrangement(policy_id_2, node1).call({'from': client})
     # Can't revoke null arrangement (it's nonexistent)
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = policy_manager.functions.revokeArrangement(policy_id_2, BlockchainInterface.NULL_ADDRESS).transact({'from': client})
-        testerchain.wait_for_receipt(tx)
+    with pytest.raises(TransactionFailed):
+        policy_manager.functions.revokeArrangement(policy_id_2, BlockchainInterface.NULL_ADDRESS).call({'from': client})
 
     # Revoke policy with remaining arrangements
     tx = policy_manager.functions.revokePolicy(policy_id_2).transact({'from': client, 'gas_price': 0})
@@ -228,24 +214,19 @@ def test_create_revoke(testerchain, escrow, policy_manager):
     assert 4 * value == event_args['value']
 
     # Can't revoke policy again because policy and all arrangements are disabled
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = policy_manager.functions.revokePolicy(policy_id_2).transact({'from': client})
-        testerchain.wait_for_receipt(tx)
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = policy_manager.functions.revokeArrangement(policy_id_2, node1).transact({'from': client})
-        testerchain.wait_for_receipt(tx)
+    with pytest.raises(TransactionFailed):
+        policy_manager.functions.revokePolicy(policy_id_2).call({'from': client})
+    with pytest.raises(TransactionFailed):
+        policy_manager.functions.revokeArrangement(policy_id_2, node1).call({'from': client})
 
     # Can't create policy with wrong ETH value - when reward is not calculated by formula:
     # numberOfNodes * (firstPartialReward + rewardRate * numberOfPeriods)
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = policy_manager.functions.createPolicy(policy_id_3, 10, 0, [node1]).transact({'from': client, 'value': 11})
-        testerchain.wait_for_receipt(tx)
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = policy_manager.functions.createPolicy(policy_id_3, 10, 1, [node1]).transact({'from': client, 'value': 22})
-        testerchain.wait_for_receipt(tx)
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = policy_manager.functions.createPolicy(policy_id_3, 10, 1, [node1]).transact({'from': client, 'value': 11})
-        testerchain.wait_for_receipt(tx)
+    with pytest.raises(TransactionFailed):
+        policy_manager.functions.createPolicy(policy_id_3, 10, 0, [node1]).call({'from': client, 'value': 11})
+    with pytest.raises(TransactionFailed):
+        policy_manager.functions.createPolicy(policy_id_3, 10, 1, [node1]).call({'from': client, 'value': 22})
+    with pytest.raises(TransactionFailed):
+        policy_manager.functions.createPolicy(policy_id_3, 10, 1, [node1]).call({'from': client, 'value': 11})
 
     # Set minimum reward rate for nodes
     tx = policy_manager.functions.setMinRewardRate(10).transact({'from': node1})
@@ -256,14 +237,10 @@ def test_create_revoke(testerchain, escrow, policy_manager):
     assert 20 == policy_manager.functions.nodes(node2).call()[MIN_REWARD_RATE_FIELD]
 
     # Try to create policy with low rate
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = policy_manager.functions.createPolicy(policy_id_3, 1, 0, [node1])\
-            .transact({'from': client, 'value': 5})
-        testerchain.wait_for_receipt(tx)
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = policy_manager.functions.createPolicy(policy_id_3, 1, 0, [node1, node2])\
-            .transact({'from': client, 'value': 30})
-        testerchain.wait_for_receipt(tx)
+    with pytest.raises(TransactionFailed):
+        policy_manager.functions.createPolicy(policy_id_3, 1, 0, [node1]).call({'from': client, 'value': 5})
+    with pytest.raises(TransactionFailed):
+        policy_manager.functions.createPolicy(policy_id_3, 1, 0, [node1, node2]).call({'from': client, 'value': 30})
 
     # Create new policy with payment for the first period
     period = escrow.functions.getCurrentPeriod().call()
@@ -87,7 +87,8 @@ def test_reward(testerchain, escrow, policy_manager):
     assert node_balance + 80 == testerchain.client.get_balance(node1)
     assert 120 + value == testerchain.client.get_balance(policy_manager.address)
 
-    events = withdraw_log.get_all_entries()
+    # Poll only the delta since the last check instead of re-decoding history
+    events = withdraw_log.get_new_entries()
     assert 1 == len(events)
     event_args = events[0]['args']
     assert node1 == event_args['node']
@@ -97,8 +98,9 @@ def test_reward(testerchain, escrow, policy_manager):
     # Mint more periods
     for x in range(6):
         tx = escrow.functions.mint(period, 1).transact({'from': node1, 'gas_price': 0})
-        testerchain.wait_for_receipt(tx)
         period += 1
+    # Transactions from the same sender are mined in order, so one receipt wait is enough
+    testerchain.wait_for_receipt(tx)
     assert 120 == policy_manager.functions.nodes(node1).call()[REWARD_FIELD]
     tx = escrow.functions.mint(period, 1).transact({'from': node1, 'gas_price': 0})
     testerchain.wait_for_receipt(tx)
@@ -110,9 +112,9 @@ def test_reward(testerchain, escrow, policy_manager):
     assert node_balance + value == testerchain.client.get_balance(node1)
     assert value == testerchain.client.get_balance(policy_manager.address)
 
-    events = withdraw_log.get_all_entries()
-    assert 2 == len(events)
-    event_args = events[1]['args']
+    events = withdraw_log.get_new_entries()
+    assert 1 == len(events)
+    event_args = events[0]['args']
     assert node1 == event_args['node']
     assert node1 == event_args['recipient']
     assert 120 == event_args['value']
@@ -132,8 +134,9 @@ def test_reward(testerchain, escrow, policy_manager):
     # Mint more periods
     for x in range(6):
         tx = escrow.functions.mint(period, 1).transact({'from': node2, 'gas_price': 0})
-        testerchain.wait_for_receipt(tx)
         period += 1
+    # Transactions from the same sender are mined in order, so one receipt wait is enough
+    testerchain.wait_for_receipt(tx)
     assert 210 == policy_manager.functions.nodes(node2).call()[REWARD_FIELD]
 
     # Withdraw the second node reward to the first node
@@ -145,9 +148,9 @@ def test_reward(testerchain, escrow, policy_manager):
     assert node_2_balance == testerchain.client.get_balance(node2)
     assert value + 210 == testerchain.client.get_balance(policy_manager.address)
 
-    events = withdraw_log.get_all_entries()
-    assert 3 == len(events)
-    event_args = events[2]['args']
+    events = withdraw_log.get_new_entries()
+    assert 1 == len(events)
+    event_args = events[0]['args']
     assert node2 == event_args['node']
     assert node1 == event_args['recipient']
     assert 210 == event_args['value']
@@ -193,7 +196,7 @@ def test_refund(testerchain, escrow, policy_manager):
     assert client_balance - 20 == testerchain.client.get_balance(client)
     assert client == policy_manager.functions.policies(policy_id).call()[CLIENT_FIELD]
 
-    events = arrangement_refund_log.get_all_entries()
+    events = arrangement_refund_log.get_new_entries()
     assert 1 == len(events)
     event_args = events[0]['args']
     assert policy_id == event_args['policyId']
@@ -201,7 +204,7 @@ def test_refund(testerchain, escrow, policy_manager):
     assert node1 == event_args['node']
     assert 190 == event_args['value']
 
-    events = policy_refund_log.get_all_entries()
+    events = policy_refund_log.get_new_entries()
     assert 1 == len(events)
     event_args = events[0]['args']
     assert policy_id == event_args['policyId']
@@ -219,9 +222,9 @@ def test_refund(testerchain, escrow, policy_manager):
     assert client_balance == testerchain.client.get_balance(client)
     assert policy_manager.functions.policies(policy_id).call()[DISABLED_FIELD]
 
-    events = arrangement_refund_log.get_all_entries()
-    assert 1 == len(events)
-    events = arrangement_revoked_log.get_all_entries()
+    events = arrangement_refund_log.get_new_entries()
+    assert 0 == len(events)
+    events = arrangement_revoked_log.get_new_entries()
     assert 1 == len(events)
     event_args = events[0]['args']
     assert policy_id == event_args['policyId']
@@ -229,9 +232,9 @@ def test_refund(testerchain, escrow, policy_manager):
     assert node1 == event_args['node']
     assert 20 == event_args['value']
 
-    events = policy_refund_log.get_all_entries()
-    assert 1 == len(events)
-    events = policy_revoked_log.get_all_entries()
+    events = policy_refund_log.get_new_entries()
+    assert 0 == len(events)
+    events = policy_revoked_log.get_new_entries()
     assert 1 == len(events)
     event_args = events[0]['args']
     assert policy_id == event_args['policyId']
@@ -274,35 +277,35 @@ def test_refund(testerchain, escrow, policy_manager):
     assert 3 * value + 1.5 * rate == testerchain.client.get_balance(policy_manager.address)
     assert client_balance - int(3 * value + 1.5 * rate) == testerchain.client.get_balance(client)
 
-    events = arrangement_refund_log.get_all_entries()
-    assert 5 == len(events)
-    event_args = events[1]['args']
+    events = arrangement_refund_log.get_new_entries()
+    assert 4 == len(events)
+    event_args = events[0]['args']
     assert policy_id_2 == event_args['policyId']
     assert client == event_args['client']
     assert node1 == event_args['node']
     assert 0 == event_args['value']
 
-    event_args = events[2]['args']
+    event_args = events[1]['args']
     assert policy_id_2 == event_args['policyId']
     assert client == event_args['client']
     assert node2 == event_args['node']
     assert 0 == event_args['value']
 
-    event_args = events[3]['args']
+    event_args = events[2]['args']
     assert policy_id_2 == event_args['policyId']
     assert client == event_args['client']
     assert node3 == event_args['node']
     assert 0 == event_args['value']
 
-    event_args = events[4]['args']
+    event_args = events[3]['args']
     assert policy_id_2 == event_args['policyId']
     assert client == event_args['client']
     assert node1 == event_args['node']
     assert 0 == event_args['value']
 
-    events = policy_refund_log.get_all_entries()
-    assert 2 == len(events)
-    event_args = events[1]['args']
+    events = policy_refund_log.get_new_entries()
+    assert 1 == len(events)
+    event_args = events[0]['args']
     assert policy_id_2 == event_args['policyId']
     assert client == event_args['client']
     assert 0 == event_args['value']
@@ -349,18 +352,18 @@ def test_refund(testerchain, escrow, policy_manager):
     assert client_balance - (2 * value + 90 + rate) == testerchain.client.get_balance(client)
     assert not policy_manager.functions.policies(policy_id_2).call()[DISABLED_FIELD]
 
-    events = arrangement_refund_log.get_all_entries()
-    assert 5 == len(events)
-    events = arrangement_revoked_log.get_all_entries()
-    assert 2 == len(events)
-    event_args = events[1]['args']
+    events = arrangement_refund_log.get_new_entries()
+    assert 0 == len(events)
+    events = arrangement_revoked_log.get_new_entries()
+    assert 1 == len(events)
+    event_args = events[0]['args']
     assert policy_id_2 == event_args['policyId']
     assert client == event_args['client']
     assert node1 == event_args['node']
     assert 120 == event_args['value']
 
-    events = policy_refund_log.get_all_entries()
-    assert 2 == len(events)
+    events = policy_refund_log.get_new_entries()
+    assert 0 == len(events)
 
     # Can't refund arrangement again because it's disabled
     with pytest.raises((TransactionFailed, ValueError)):
@@ -384,27 +387,27 @@ def test_refund(testerchain, escrow, policy_manager):
     assert client_balance - 3 * 90 == testerchain.client.get_balance(client)
     assert policy_manager.functions.policies(policy_id_2).call()[DISABLED_FIELD]
 
-    events = arrangement_refund_log.get_all_entries()
-    assert 5 == len(events)
-    events = arrangement_revoked_log.get_all_entries()
-    assert 4 == len(events)
-    event_args = events[2]['args']
+    events = arrangement_refund_log.get_new_entries()
+    assert 0 == len(events)
+    events = arrangement_revoked_log.get_new_entries()
+    assert 2 == len(events)
+    event_args = events[0]['args']
     assert policy_id_2 == event_args['policyId']
     assert client == event_args['client']
     assert node2 == event_args['node']
     assert 120 == event_args['value']
 
-    event_args = events[3]['args']
+    event_args = events[1]['args']
     assert policy_id_2 == event_args['policyId']
     assert client == event_args['client']
     assert node3 == event_args['node']
     assert 120 == event_args['value']
 
-    events = policy_refund_log.get_all_entries()
-    assert 2 == len(events)
-    events = policy_revoked_log.get_all_entries()
-    assert 2 == len(events)
-    event_args = events[1]['args']
+    events = policy_refund_log.get_new_entries()
+    assert 0 == len(events)
+    events = policy_revoked_log.get_new_entries()
+    assert 1 == len(events)
+    event_args = events[0]['args']
     assert policy_id_2 == event_args['policyId']
     assert client == event_args['client']
     assert 2 * 120 == event_args['value']
@@ -422,7 +425,8 @@ def test_refund(testerchain, escrow, policy_manager):
     for x in range(3):
         period += 1
         tx = escrow.functions.mint(period, 1).transact({'from': node1})
-        testerchain.wait_for_receipt(tx)
+    # Transactions from the same sender are mined in order, so one receipt wait is enough
+    testerchain.wait_for_receipt(tx)
     tx = escrow.functions.setLastActivePeriod(period).transact({'from': creator})
     testerchain.wait_for_receipt(tx)
     assert 150 == policy_manager.functions.nodes(node1).call()[REWARD_FIELD]
@@ -438,22 +442,22 @@ def test_refund(testerchain, escrow, policy_manager):
     assert client_balance - (60 + 3 * 90) == testerchain.client.get_balance(client)
     assert policy_manager.functions.policies(policy_id_3).call()[DISABLED_FIELD]
 
-    events = arrangement_refund_log.get_all_entries()
-    assert 5 == len(events)
-    events = policy_refund_log.get_all_entries()
-    assert 2 == len(events)
+    events = arrangement_refund_log.get_new_entries()
+    assert 0 == len(events)
+    events = policy_refund_log.get_new_entries()
+    assert 0 == len(events)
 
-    events = arrangement_revoked_log.get_all_entries()
-    assert 5 == len(events)
-    event_args = events[4]['args']
+    events = arrangement_revoked_log.get_new_entries()
+    assert 1 == len(events)
+    event_args = events[0]['args']
     assert policy_id_3 == event_args['policyId']
     assert client == event_args['client']
     assert node1 == event_args['node']
     assert 150 == event_args['value']
 
-    events = policy_revoked_log.get_all_entries()
-    assert 3 == len(events)
-    event_args = events[2]['args']
+    events = policy_revoked_log.get_new_entries()
+    assert 1 == len(events)
+    event_args = events[0]['args']
     assert policy_id_3 == event_args['policyId']
     assert client == event_args['client']
     assert 150 == event_args['value']
@@ -462,7 +466,8 @@ def test_refund(testerchain, escrow, policy_manager):
     for x in range(20):
         period += 1
         tx = escrow.functions.mint(period, 1).transact({'from': node1})
-        testerchain.wait_for_receipt(tx)
+    # Transactions from the same sender are mined in order, so one receipt wait is enough
+    testerchain.wait_for_receipt(tx)
     assert 150 == policy_manager.functions.nodes(node1).call()[REWARD_FIELD]
 
 
@@ -489,17 +494,17 @@ def test_refund(testerchain, escrow, policy_manager):
     testerchain.wait_for_receipt(tx)
     assert client_balance + refund_value == testerchain.client.get_balance(client)
 
-    events = arrangement_refund_log.get_all_entries()
-    assert 6 == len(events)
-    event_args = events[5]['args']
+    events = arrangement_refund_log.get_new_entries()
+    assert 1 == len(events)
+    event_args = events[0]['args']
     assert policy_id_4 == event_args['policyId']
     assert client == event_args['client']
     assert node1 == event_args['node']
     assert refund_value == event_args['value']
 
-    events = policy_refund_log.get_all_entries()
-    assert 3 == len(events)
-    event_args = events[2]['args']
+    events = policy_refund_log.get_new_entries()
+    assert 1 == len(events)
+    event_args = events[0]['args']
     assert policy_id_4 == event_args['policyId']
     assert client == event_args['client']
     assert refund_value == event_args['value']
@@ -511,15 +516,15 @@ def test_refund(testerchain, escrow, policy_manager):
     testerchain.wait_for_receipt(tx)
     assert client_balance == testerchain.client.get_balance(client)
 
-    events = arrangement_refund_log.get_all_entries()
-    assert 7 == len(events)
-    event_args = events[6]['args']
+    events = arrangement_refund_log.get_new_entries()
+    assert 1 == len(events)
+    event_args = events[0]['args']
     assert policy_id_4 == event_args['policyId']
     assert client == event_args['client']
     assert node1 == event_args['node']
     assert 0 == event_args['value']
 
-    events = policy_created_log.get_all_entries()
+    events = policy_created_log.get_new_entries()
     assert 4 == len(events)
 
 
@@ -564,7 +569,7 @@ def test_reentrancy(testerchain, escrow, policy_manager, deploy_contract):
         testerchain.wait_for_receipt(tx)
     assert balance == testerchain.client.get_balance(contract_address)
     assert rate == policy_manager.functions.nodes(contract_address).call()[REWARD_FIELD]
-    assert 0 == len(withdraw_log.get_all_entries())
+    assert 0 == len(withdraw_log.get_new_entries())
 
     # Prepare for refund and check reentrancy protection
     tx = escrow.functions.setLastActivePeriod(period).transact()
@@ -578,7 +583,7 @@ def test_reentrancy(testerchain, escrow, policy_manager, deploy_contract):
     assert balance == testerchain.client.get_balance(contract_address)
     assert not policy_manager.functions.policies(policy_id).call()[DISABLED_FIELD]
     assert rate == policy_manager.functions.nodes(contract_address).call()[REWARD_FIELD]
-    assert 0 == len(arrangement_revoked_log.get_all_entries())
-    assert 0 == len(policy_revoked_log.get_all_entries())
-    assert 0 == len(arrangement_refund_log.get_all_entries())
-    assert 0 == len(policy_refund_log.get_all_entries())
+    assert 0 == len(arrangement_revoked_log.get_new_entries())
+    assert 0 == len(policy_revoked_log.get_new_entries())
+    assert 0 == len(arrangement_refund_log.get_new_entries())
+    assert 0 == len(policy_refund_log.get_new_entries())
@@ -21,16 +21,17 @@ import pytest
 from eth_utils import keccak
 from web3.contract import Contract
 
-from nucypher.blockchain.eth.token import NU
+TOTAL_SUPPLY = 2 * 10 ** 9  # NuNits
 
-@pytest.fixture()
+
+@pytest.fixture(scope='module')
 def token(testerchain, deploy_contract):
     # Create an ERC20 token
-    token, _ = deploy_contract('NuCypherToken', _totalSupply=int(NU(2 * 10 ** 9, 'NuNit')))
+    token, _ = deploy_contract('NuCypherToken', _totalSupply=TOTAL_SUPPLY)
     return token
 
 
-@pytest.fixture()
+@pytest.fixture(scope='module')
 def escrow(testerchain, token, deploy_contract):
     creator = testerchain.client.accounts[0]
     # Creator deploys the escrow
@@ -43,13 +44,13 @@ def escrow(testerchain, token, deploy_contract):
     return contract
 
 
-@pytest.fixture()
+@pytest.fixture(scope='module')
 def policy_manager(testerchain, deploy_contract):
     contract, _ = deploy_contract('PolicyManagerForStakingContractMock')
     return contract
 
 
-@pytest.fixture()
+@pytest.fixture(scope='module')
 def staking_interface(testerchain, token, escrow, policy_manager, deploy_contract):
     # Creator deploys the staking interface
     contract, _ = deploy_contract(
@@ -57,7 +58,7 @@ def staking_interface(testerchain, token, escrow, policy_manager, deploy_contrac
     return contract
 
 
-@pytest.fixture()
+@pytest.fixture(scope='module')
 def router(testerchain, staking_interface, deploy_contract):
     secret = os.urandom(32)
     secret_hash = keccak(secret)
@@ -65,7 +66,7 @@ def router(testerchain, staking_interface, deploy_contract):
     return contract
 
 
-@pytest.fixture()
+@pytest.fixture(scope='module')
 def preallocation_escrow(testerchain, token, router, deploy_contract, escrow):
     creator = testerchain.client.accounts[0]
     user = testerchain.client.accounts[1]
@@ -78,9 +79,22 @@ def preallocation_escrow(testerchain, token, router, deploy_contract, escrow):
     return contract
 
 
-@pytest.fixture()
+@pytest.fixture(scope='module')
 def preallocation_escrow_interface(testerchain, staking_interface, preallocation_escrow):
     return testerchain.client.get_contract(
         abi=staking_interface.abi,
         address=preallocation_escrow.address,
         ContractFactoryClass=Contract)
+
+
+@pytest.fixture()
+def initial_deposit(testerchain, token, preallocation_escrow):
+    def make_deposit(value, duration):
+        creator = testerchain.client.accounts[0]
+        tx = token.functions.approve(preallocation_escrow.address, value).transact({'from': creator})
+        testerchain.wait_for_receipt(tx)
+        tx = preallocation_escrow.functions.initialDeposit(value, duration).transact({'from': creator})
+        return testerchain.wait_for_receipt(tx)
+
+    return make_deposit
+
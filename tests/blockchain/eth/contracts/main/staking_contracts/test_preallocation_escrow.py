@@ -23,22 +23,19 @@ from eth_tester.exceptions import TransactionFailed
 
 
 @pytest.mark.slow
-def test_escrow(testerchain, token, preallocation_escrow):
+def test_escrow(testerchain, token, preallocation_escrow, initial_deposit):
     creator = testerchain.client.accounts[0]
     owner = testerchain.client.accounts[1]
-    deposits = preallocation_escrow.events.TokensDeposited.createFilter(fromBlock='latest')
 
     # Deposit some tokens to the preallocation escrow and lock them
-    tx = token.functions.approve(preallocation_escrow.address, 2000).transact({'from': creator})
-    testerchain.wait_for_receipt(tx)
-    tx = preallocation_escrow.functions.initialDeposit(1000, 1000).transact({'from': creator})
-    testerchain.wait_for_receipt(tx)
+    receipt = initial_deposit(1000, 1000)
     # Check locked tokens
     assert 1000 == token.functions.balanceOf(preallocation_escrow.address).call()
     assert owner == preallocation_escrow.functions.owner().call()
     assert 1000 == preallocation_escrow.functions.getLockedTokens().call()
 
-    events = deposits.get_all_entries()
+    # Decode events from the receipts instead of installing filters
+    events = preallocation_escrow.events.TokensDeposited().processReceipt(receipt)
     assert 1 == len(events)
     event_args = events[0]['args']
     assert creator == event_args['sender']
@@ -61,18 +58,16 @@ def test_escrow(testerchain, token, preallocation_escrow):
     assert 1300 == token.functions.balanceOf(preallocation_escrow.address).call()
     assert 1000 == preallocation_escrow.functions.getLockedTokens().call()
 
-    withdraws = preallocation_escrow.events.TokensWithdrawn.createFilter(fromBlock='latest')
-
     # Only owner can withdraw available tokens
     with pytest.raises((TransactionFailed, ValueError)):
         tx = preallocation_escrow.functions.withdrawTokens(1).transact({'from': creator})
         testerchain.wait_for_receipt(tx)
     tx = preallocation_escrow.functions.withdrawTokens(300).transact({'from': owner})
-    testerchain.wait_for_receipt(tx)
+    receipt = testerchain.wait_for_receipt(tx)
     assert 300 == token.functions.balanceOf(owner).call()
     assert 1000 == token.functions.balanceOf(preallocation_escrow.address).call()
 
-    events = withdraws.get_all_entries()
+    events = preallocation_escrow.events.TokensWithdrawn().processReceipt(receipt)
     assert 1 == len(events)
     event_args = events[0]['args']
     assert owner == event_args['owner']
@@ -93,35 +88,39 @@ def test_escrow(testerchain, token, preallocation_escrow):
     testerchain.time_travel(seconds=500)
     assert 0 == preallocation_escrow.functions.getLockedTokens().call()
     tx = preallocation_escrow.functions.withdrawTokens(1000).transact({'from': owner})
-    testerchain.wait_for_receipt(tx)
+    receipt = testerchain.wait_for_receipt(tx)
     assert 0 == token.functions.balanceOf(preallocation_escrow.address).call()
     assert 1300 == token.functions.balanceOf(owner).call()
 
-    events = withdraws.get_all_entries()
-    assert 2 == len(events)
-    event_args = events[1]['args']
+    events = preallocation_escrow.events.TokensWithdrawn().processReceipt(receipt)
+    assert 1 == len(events)
+    event_args = events[0]['args']
     assert owner == event_args['owner']
     assert 1000 == event_args['value']
 
 
 @pytest.mark.slow
-def test_staker(testerchain, token, escrow, preallocation_escrow, preallocation_escrow_interface, staking_interface):
+def test_staker(testerchain, token, escrow, preallocation_escrow, preallocation_escrow_interface,
+                staking_interface, initial_deposit):
     """
     Test staker functions in the preallocation escrow
     """
     creator = testerchain.client.accounts[0]
     owner = testerchain.client.accounts[1]
 
-    deposits = preallocation_escrow.events.TokensDeposited.createFilter(fromBlock='latest')
+    def escrow_state():
+        # Collect the escrow side effects into one dict so each checkpoint
+        # is a single comparison that shows every mismatch at once
+        return {'value': escrow.functions.value().call(),
+                'lockedValue': escrow.functions.lockedValue().call(),
+                'periods': escrow.functions.periods().call(),
+                'index': escrow.functions.index().call()}
 
     # Deposit some tokens to the preallocation escrow and lock them
-    tx = token.functions.approve(preallocation_escrow.address, 2000).transact({'from': creator})
-    testerchain.wait_for_receipt(tx)
-    tx = preallocation_escrow.functions.initialDeposit(2000, 1000).transact({'from': creator})
-    testerchain.wait_for_receipt(tx)
+    receipt = initial_deposit(2000, 1000)
     assert 2000 == token.functions.balanceOf(preallocation_escrow.address).call()
 
-    events = deposits.get_all_entries()
+    events = preallocation_escrow.events.TokensDeposited().processReceipt(receipt)
     assert 1 == len(events)
 
     # Only owner can deposit tokens to the staker escrow
@@ -139,9 +138,7 @@ def test_staker(testerchain, token, escrow, preallocation_escrow, preallocation_
     tx = preallocation_escrow_interface.functions.depositAsStaker(1500, 5).transact({'from': owner})
     testerchain.wait_for_receipt(tx)
     assert preallocation_escrow.address == escrow.functions.node().call()
-    assert 1500 == escrow.functions.value().call()
-    assert 1500 == escrow.functions.lockedValue().call()
-    assert 5 == escrow.functions.periods().call()
+    assert escrow_state() == {'value': 1500, 'lockedValue': 1500, 'periods': 5, 'index': 0}
     assert 11500 == token.functions.balanceOf(escrow.address).call()
     assert 500 == token.functions.balanceOf(preallocation_escrow.address).call()
 
@@ -157,32 +154,6 @@ def test_staker(testerchain, token, escrow, preallocation_escrow, preallocation_
         tx = preallocation_escrow.functions.withdrawTokens(100).transact({'from': owner})
         testerchain.wait_for_receipt(tx)
 
-    # Owner can't use the staking interface directly
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = staking_interface.functions.lock(100, 1).transact({'from': owner})
-        testerchain.wait_for_receipt(tx)
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = staking_interface.functions.divideStake(1, 100, 1).transact({'from': owner})
-        testerchain.wait_for_receipt(tx)
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = staking_interface.functions.mint().transact({'from': owner})
-        testerchain.wait_for_receipt(tx)
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = staking_interface.functions.withdrawAsStaker(100).transact({'from': owner})
-        testerchain.wait_for_receipt(tx)
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = staking_interface.functions.setReStake(True).transact({'from': owner})
-        testerchain.wait_for_receipt(tx)
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = staking_interface.functions.lockReStake(0).transact({'from': owner})
-        testerchain.wait_for_receipt(tx)
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = staking_interface.functions.setWorker(owner).transact({'from': owner})
-        testerchain.wait_for_receipt(tx)
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = staking_interface.functions.prolongStake(2, 2).transact({'from': owner})
-        testerchain.wait_for_receipt(tx)
-
     locks = preallocation_escrow_interface.events.Locked.createFilter(fromBlock='latest')
     divides = preallocation_escrow_interface.events.Divided.createFilter(fromBlock='latest')
     mints = preallocation_escrow_interface.events.Mined.createFilter(fromBlock='latest')
@@ -196,32 +167,26 @@ def test_staker(testerchain, token, escrow, preallocation_escrow, preallocation_
     # Use stakers methods through the preallocation escrow
     tx = preallocation_escrow_interface.functions.lock(100, 1).transact({'from': owner})
     testerchain.wait_for_receipt(tx)
-    assert 1500 == escrow.functions.value().call()
-    assert 1600 == escrow.functions.lockedValue().call()
-    assert 6 == escrow.functions.periods().call()
+    assert escrow_state() == {'value': 1500, 'lockedValue': 1600, 'periods': 6, 'index': 0}
     tx = preallocation_escrow_interface.functions.divideStake(1, 100, 1).transact({'from': owner})
     testerchain.wait_for_receipt(tx)
-    assert 1500 == escrow.functions.value().call()
-    assert 1700 == escrow.functions.lockedValue().call()
-    assert 1 == escrow.functions.index().call()
-    assert 7 == escrow.functions.periods().call()
+    assert escrow_state() == {'value': 1500, 'lockedValue': 1700, 'periods': 7, 'index': 1}
     tx = preallocation_escrow_interface.functions.mint().transact({'from': owner})
     testerchain.wait_for_receipt(tx)
-    assert 2500 == escrow.functions.value().call()
+    assert escrow_state() == {'value': 2500, 'lockedValue': 1700, 'periods': 7, 'index': 1}
     tx = preallocation_escrow_interface.functions.withdrawAsStaker(1500).transact({'from': owner})
     testerchain.wait_for_receipt(tx)
-    assert 1000 == escrow.functions.value().call()
+    assert escrow_state() == {'value': 1000, 'lockedValue': 1700, 'periods': 7, 'index': 1}
     assert 10000 == token.functions.balanceOf(escrow.address).call()
     assert 2000 == token.functions.balanceOf(preallocation_escrow.address).call()
     tx = preallocation_escrow_interface.functions.withdrawAsStaker(1000).transact({'from': owner})
     testerchain.wait_for_receipt(tx)
-    assert 0 == escrow.functions.value().call()
+    assert escrow_state() == {'value': 0, 'lockedValue': 1700, 'periods': 7, 'index': 1}
     assert 9000 == token.functions.balanceOf(escrow.address).call()
     assert 3000 == token.functions.balanceOf(preallocation_escrow.address).call()
     tx = preallocation_escrow_interface.functions.prolongStake(2, 2).transact({'from': owner})
     testerchain.wait_for_receipt(tx)
-    assert 2 == escrow.functions.index().call()
-    assert 9 == escrow.functions.periods().call()
+    assert escrow_state() == {'value': 0, 'lockedValue': 1700, 'periods': 9, 'index': 2}
 
     # Test re-stake methods
     tx = preallocation_escrow_interface.functions.setReStake(True).transact({'from': owner})
@@ -306,6 +271,28 @@ def test_staker(testerchain, token, escrow, preallocation_escrow, preallocation_
     assert 1000 == event_args['value']
 
 
+@pytest.mark.slow
+@pytest.mark.parametrize('method, args', [
+    ('lock', (100, 1)),
+    ('divideStake', (1, 100, 1)),
+    ('mint', ()),
+    ('withdrawAsStaker', (100,)),
+    ('setReStake', (True,)),
+    ('lockReStake', (0,)),
+    ('setWorker', ('0x' + '0' * 40,)),
+    ('prolongStake', (2, 2)),
+])
+def test_interface_direct_call(testerchain, staking_interface, method, args):
+    """
+    The staking interface is executed via delegatecall through the router,
+    so the owner can't use it directly
+    """
+    owner = testerchain.client.accounts[1]
+    with pytest.raises((TransactionFailed, ValueError)):
+        tx = getattr(staking_interface.functions, method)(*args).transact({'from': owner})
+        testerchain.wait_for_receipt(tx)
+
+
 @pytest.mark.slow
 def test_policy(testerchain, policy_manager, preallocation_escrow, preallocation_escrow_interface):
     """
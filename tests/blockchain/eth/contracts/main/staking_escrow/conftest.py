@@ -21,14 +21,11 @@ from web3.contract import Contract
 from eth_utils import keccak
 
 from nucypher.blockchain.economics import TokenEconomics
-from nucypher.blockchain.eth.token import NU
-
-VALUE_FIELD = 0
 
 secret = (123456).to_bytes(32, byteorder='big')
 
 
-@pytest.fixture()
+@pytest.fixture(scope='module')
 def token_economics():
     economics = TokenEconomics(initial_supply=10 ** 9,
                                total_supply=2 * 10 ** 9,
@@ -42,7 +39,7 @@ def token_economics():
     return economics
 
 
-@pytest.fixture()
+@pytest.fixture(scope='module')
 def token(deploy_contract, token_economics):
     # Create an ERC20 token
     token, _ = deploy_contract('NuCypherToken', _totalSupply=token_economics.erc20_total_supply)
@@ -199,6 +199,7 @@ def test_upgrading(testerchain, token, token_economics, deploy_contract):
 @pytest.mark.slow
 def test_re_stake(testerchain, token, escrow_contract):
     escrow = escrow_contract(10000)
+    escrow_functions = escrow.functions
     creator = testerchain.client.accounts[0]
     ursula = testerchain.client.accounts[1]
     ursula2 = testerchain.client.accounts[2]
@@ -209,23 +210,23 @@ def test_re_stake(testerchain, token, escrow_contract):
     # Give Escrow tokens for reward and initialize contract
     tx = token.functions.transfer(escrow.address, 10 ** 9).transact({'from': creator})
     testerchain.wait_for_receipt(tx)
-    tx = escrow.functions.initialize().transact({'from': creator})
+    tx = escrow_functions.initialize().transact({'from': creator})
     testerchain.wait_for_receipt(tx)
 
     # Set re-stake parameter even before initialization
-    assert not escrow.functions.stakerInfo(ursula).call()[RE_STAKE_FIELD]
-    tx = escrow.functions.setReStake(False).transact({'from': ursula})
+    assert not escrow_functions.stakerInfo(ursula).call()[RE_STAKE_FIELD]
+    tx = escrow_functions.setReStake(False).transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
-    assert not escrow.functions.stakerInfo(ursula).call()[RE_STAKE_FIELD]
-    tx = escrow.functions.setReStake(True).transact({'from': ursula})
+    assert not escrow_functions.stakerInfo(ursula).call()[RE_STAKE_FIELD]
+    tx = escrow_functions.setReStake(True).transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
-    assert escrow.functions.stakerInfo(ursula).call()[RE_STAKE_FIELD]
-    tx = escrow.functions.setReStake(True).transact({'from': ursula})
+    assert escrow_functions.stakerInfo(ursula).call()[RE_STAKE_FIELD]
+    tx = escrow_functions.setReStake(True).transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
-    assert escrow.functions.stakerInfo(ursula).call()[RE_STAKE_FIELD]
-    tx = escrow.functions.setReStake(False).transact({'from': ursula})
+    assert escrow_functions.stakerInfo(ursula).call()[RE_STAKE_FIELD]
+    tx = escrow_functions.setReStake(False).transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
-    assert not escrow.functions.stakerInfo(ursula).call()[RE_STAKE_FIELD]
+    assert not escrow_functions.stakerInfo(ursula).call()[RE_STAKE_FIELD]
 
     events = re_stake_log.get_all_entries()
     assert 2 == len(events)
@@ -237,12 +238,12 @@ def test_re_stake(testerchain, token, escrow_contract):
     assert not event_args['reStake']
 
     # Lock re-stake parameter during 1 period
-    period = escrow.functions.getCurrentPeriod().call()
-    tx = escrow.functions.lockReStake(period + 1).transact({'from': ursula})
+    period = escrow_functions.getCurrentPeriod().call()
+    tx = escrow_functions.lockReStake(period + 1).transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
     # Can't set re-stake parameter in the current period
     with pytest.raises((TransactionFailed, ValueError)):
-        tx = escrow.functions.setReStake(True).transact({'from': ursula})
+        tx = escrow_functions.setReStake(True).transact({'from': ursula})
         testerchain.wait_for_receipt(tx)
 
     events = re_stake_lock_log.get_all_entries()
@@ -257,51 +258,51 @@ def test_re_stake(testerchain, token, escrow_contract):
     tx = token.functions.approve(escrow.address, 10000).transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
     sub_stake = 100
-    tx = escrow.functions.deposit(sub_stake, 10).transact({'from': ursula})
+    tx = escrow_functions.deposit(sub_stake, 10).transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
-    tx = escrow.functions.setWorker(ursula).transact({'from': ursula})
+    tx = escrow_functions.setWorker(ursula).transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
-    tx = escrow.functions.confirmActivity().transact({'from': ursula})
+    tx = escrow_functions.confirmActivity().transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
     testerchain.time_travel(hours=1)
-    period = escrow.functions.getCurrentPeriod().call()
-    assert sub_stake == escrow.functions.getAllTokens(ursula).call()
-    assert sub_stake == escrow.functions.getLockedTokens(ursula, 0).call()
-    assert sub_stake == escrow.functions.lockedPerPeriod(period).call()
-    assert 0 == escrow.functions.lockedPerPeriod(period + 1).call()
+    period = escrow_functions.getCurrentPeriod().call()
+    assert sub_stake == escrow_functions.getAllTokens(ursula).call()
+    assert sub_stake == escrow_functions.getLockedTokens(ursula, 0).call()
+    assert sub_stake == escrow_functions.lockedPerPeriod(period).call()
+    assert 0 == escrow_functions.lockedPerPeriod(period + 1).call()
 
     # Confirm activity and try to mine without re-stake
-    tx = escrow.functions.confirmActivity().transact({'from': ursula})
+    tx = escrow_functions.confirmActivity().transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
     testerchain.time_travel(hours=1)
-    period = escrow.functions.getCurrentPeriod().call()
-    assert sub_stake == escrow.functions.getAllTokens(ursula).call()
-    assert sub_stake == escrow.functions.getLockedTokens(ursula, 0).call()
-    assert sub_stake == escrow.functions.lockedPerPeriod(period - 1).call()
-    assert sub_stake == escrow.functions.lockedPerPeriod(period).call()
-    tx = escrow.functions.mint().transact({'from': ursula})
+    period = escrow_functions.getCurrentPeriod().call()
+    assert sub_stake == escrow_functions.getAllTokens(ursula).call()
+    assert sub_stake == escrow_functions.getLockedTokens(ursula, 0).call()
+    assert sub_stake == escrow_functions.lockedPerPeriod(period - 1).call()
+    assert sub_stake == escrow_functions.lockedPerPeriod(period).call()
+    tx = escrow_functions.mint().transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
     # Reward is not locked and stake is not changed
-    assert sub_stake < escrow.functions.getAllTokens(ursula).call()
-    assert sub_stake == escrow.functions.getLockedTokens(ursula, 0).call()
-    assert sub_stake == escrow.functions.lockedPerPeriod(period - 1).call()
-    assert sub_stake == escrow.functions.lockedPerPeriod(period).call()
+    balance = escrow_functions.getAllTokens(ursula).call()
+    assert sub_stake < balance
+    assert sub_stake == escrow_functions.getLockedTokens(ursula, 0).call()
+    assert sub_stake == escrow_functions.lockedPerPeriod(period - 1).call()
+    assert sub_stake == escrow_functions.lockedPerPeriod(period).call()
 
     # Prepare account, withdraw reward
-    balance = escrow.functions.getAllTokens(ursula).call()
-    tx = escrow.functions.withdraw(balance - sub_stake).transact({'from': ursula})
+    tx = escrow_functions.withdraw(balance - sub_stake).transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
-    assert sub_stake == escrow.functions.getAllTokens(ursula).call()
+    assert sub_stake == escrow_functions.getAllTokens(ursula).call()
 
     # Set re-stake and lock parameter
-    tx = escrow.functions.setReStake(True).transact({'from': ursula})
+    tx = escrow_functions.setReStake(True).transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
-    assert escrow.functions.stakerInfo(ursula).call()[RE_STAKE_FIELD]
-    tx = escrow.functions.lockReStake(period + 6).transact({'from': ursula})
+    assert escrow_functions.stakerInfo(ursula).call()[RE_STAKE_FIELD]
+    tx = escrow_functions.lockReStake(period + 6).transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
     # Can't set re-stake parameter during 6 periods
     with pytest.raises((TransactionFailed, ValueError)):
-        tx = escrow.functions.setReStake(False).transact({'from': ursula})
+        tx = escrow_functions.setReStake(False).transact({'from': ursula})
         testerchain.wait_for_receipt(tx)
 
     events = re_stake_log.get_all_entries()
@@ -316,126 +317,126 @@ def test_re_stake(testerchain, token, escrow_contract):
     assert period + 6 == event_args['lockUntilPeriod']
 
     # Confirm activity and try to mine with re-stake
-    tx = escrow.functions.confirmActivity().transact({'from': ursula})
+    tx = escrow_functions.confirmActivity().transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
     testerchain.time_travel(hours=1)
-    period = escrow.functions.getCurrentPeriod().call()
-    assert sub_stake == escrow.functions.getAllTokens(ursula).call()
-    assert sub_stake == escrow.functions.getLockedTokens(ursula, 0).call()
-    assert sub_stake == escrow.functions.lockedPerPeriod(period - 1).call()
-    assert sub_stake == escrow.functions.lockedPerPeriod(period).call()
-    tx = escrow.functions.mint().transact({'from': ursula})
+    period = escrow_functions.getCurrentPeriod().call()
+    assert sub_stake == escrow_functions.getAllTokens(ursula).call()
+    assert sub_stake == escrow_functions.getLockedTokens(ursula, 0).call()
+    assert sub_stake == escrow_functions.lockedPerPeriod(period - 1).call()
+    assert sub_stake == escrow_functions.lockedPerPeriod(period).call()
+    tx = escrow_functions.mint().transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
     # Entire reward is locked
-    balance = escrow.functions.getAllTokens(ursula).call()
-    new_sub_stake = escrow.functions.getLockedTokens(ursula, 0).call()
+    balance = escrow_functions.getAllTokens(ursula).call()
+    new_sub_stake = escrow_functions.getLockedTokens(ursula, 0).call()
     assert sub_stake < balance
     assert balance == new_sub_stake
-    assert sub_stake == escrow.functions.lockedPerPeriod(period - 1).call()
-    assert new_sub_stake == escrow.functions.lockedPerPeriod(period).call()
+    assert sub_stake == escrow_functions.lockedPerPeriod(period - 1).call()
+    assert new_sub_stake == escrow_functions.lockedPerPeriod(period).call()
 
     # Mine with re-stake again
     testerchain.time_travel(hours=1)
-    period = escrow.functions.getCurrentPeriod().call()
+    period = escrow_functions.getCurrentPeriod().call()
     sub_stake = new_sub_stake
-    assert sub_stake == escrow.functions.getAllTokens(ursula).call()
-    assert sub_stake == escrow.functions.getLockedTokens(ursula, 0).call()
-    assert sub_stake == escrow.functions.lockedPerPeriod(period - 1).call()
-    assert 0 == escrow.functions.lockedPerPeriod(period).call()
-    tx = escrow.functions.mint().transact({'from': ursula})
+    assert sub_stake == escrow_functions.getAllTokens(ursula).call()
+    assert sub_stake == escrow_functions.getLockedTokens(ursula, 0).call()
+    assert sub_stake == escrow_functions.lockedPerPeriod(period - 1).call()
+    assert 0 == escrow_functions.lockedPerPeriod(period).call()
+    tx = escrow_functions.mint().transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
     # Entire reward is locked
-    balance = escrow.functions.getAllTokens(ursula).call()
-    new_sub_stake = escrow.functions.getLockedTokens(ursula, 0).call()
+    balance = escrow_functions.getAllTokens(ursula).call()
+    new_sub_stake = escrow_functions.getLockedTokens(ursula, 0).call()
     assert sub_stake < balance
     assert balance == new_sub_stake
-    assert sub_stake == escrow.functions.lockedPerPeriod(period - 1).call()
-    assert 0 == escrow.functions.lockedPerPeriod(period).call()
+    assert sub_stake == escrow_functions.lockedPerPeriod(period - 1).call()
+    assert 0 == escrow_functions.lockedPerPeriod(period).call()
 
     # Prepares test case:
     # two Ursula with the stake value and duration, that have both confirmed two subsequent past periods
     sub_stake_1 = new_sub_stake
     sub_stake_2 = sub_stake_1 // 2
     stake = sub_stake_1 + sub_stake_2
-    sub_stake_duration = escrow.functions.getSubStakeInfo(ursula, 0).call()[2]
-    tx = escrow.functions.deposit(sub_stake_2, sub_stake_duration).transact({'from': ursula})
+    sub_stake_duration = escrow_functions.getSubStakeInfo(ursula, 0).call()[2]
+    tx = escrow_functions.deposit(sub_stake_2, sub_stake_duration).transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
-    tx = escrow.functions.confirmActivity().transact({'from': ursula})
+    tx = escrow_functions.confirmActivity().transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
     tx = token.functions.transfer(ursula2, stake).transact({'from': creator})
     testerchain.wait_for_receipt(tx)
     tx = token.functions.approve(escrow.address, stake).transact({'from': ursula2})
     testerchain.wait_for_receipt(tx)
-    tx = escrow.functions.deposit(stake, sub_stake_duration).transact({'from': ursula2})
+    tx = escrow_functions.deposit(stake, sub_stake_duration).transact({'from': ursula2})
     testerchain.wait_for_receipt(tx)
-    tx = escrow.functions.setWorker(ursula2).transact({'from': ursula2})
+    tx = escrow_functions.setWorker(ursula2).transact({'from': ursula2})
     testerchain.wait_for_receipt(tx)
-    tx = escrow.functions.confirmActivity().transact({'from': ursula2})
+    tx = escrow_functions.confirmActivity().transact({'from': ursula2})
     testerchain.wait_for_receipt(tx)
     testerchain.time_travel(hours=1)
-    tx = escrow.functions.confirmActivity().transact({'from': ursula})
+    tx = escrow_functions.confirmActivity().transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
-    tx = escrow.functions.confirmActivity().transact({'from': ursula2})
+    tx = escrow_functions.confirmActivity().transact({'from': ursula2})
     testerchain.wait_for_receipt(tx)
     testerchain.time_travel(hours=2)
     # Checks preparation
-    period = escrow.functions.getCurrentPeriod().call()
-    assert stake == escrow.functions.getAllTokens(ursula).call()
-    assert stake == escrow.functions.getAllTokens(ursula2).call()
-    assert stake == escrow.functions.getLockedTokens(ursula, 0).call()
-    assert stake == escrow.functions.getLockedTokens(ursula2, 0).call()
-    assert sub_stake_1 == escrow.functions.getSubStakeInfo(ursula, 0).call()[3]
-    assert sub_stake_2 == escrow.functions.getSubStakeInfo(ursula, 1).call()[3]
-    assert 2 * stake == escrow.functions.lockedPerPeriod(period - 2).call()
-    assert 2 * stake == escrow.functions.lockedPerPeriod(period - 1).call()
-    assert 0 == escrow.functions.lockedPerPeriod(period).call()
+    period = escrow_functions.getCurrentPeriod().call()
+    assert stake == escrow_functions.getAllTokens(ursula).call()
+    assert stake == escrow_functions.getAllTokens(ursula2).call()
+    assert stake == escrow_functions.getLockedTokens(ursula, 0).call()
+    assert stake == escrow_functions.getLockedTokens(ursula2, 0).call()
+    assert sub_stake_1 == escrow_functions.getSubStakeInfo(ursula, 0).call()[3]
+    assert sub_stake_2 == escrow_functions.getSubStakeInfo(ursula, 1).call()[3]
+    assert 2 * stake == escrow_functions.lockedPerPeriod(period - 2).call()
+    assert 2 * stake == escrow_functions.lockedPerPeriod(period - 1).call()
+    assert 0 == escrow_functions.lockedPerPeriod(period).call()
 
     # Compare mining with re-stake and without for two surpassed periods
     # The first is Ursula2 because of Ursula1's re-stake will change sub stake ratio for `period - 1`
     # (stake/lockedPerPeriod) and it will affect next mining
-    tx = escrow.functions.mint().transact({'from': ursula2})
+    tx = escrow_functions.mint().transact({'from': ursula2})
     testerchain.wait_for_receipt(tx)
-    tx = escrow.functions.mint().transact({'from': ursula})
+    tx = escrow_functions.mint().transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
-    ursula_reward = escrow.functions.getAllTokens(ursula).call() - stake
-    ursula2_reward = escrow.functions.getAllTokens(ursula2).call() - stake
+    ursula_reward = escrow_functions.getAllTokens(ursula).call() - stake
+    ursula2_reward = escrow_functions.getAllTokens(ursula2).call() - stake
     assert 0 < ursula2_reward
     assert ursula_reward > ursula2_reward
     # Ursula2's stake has not changed
-    assert stake == escrow.functions.getLockedTokens(ursula2, 0).call()
+    assert stake == escrow_functions.getLockedTokens(ursula2, 0).call()
 
     # To calculate amount of re-stake we can split Ursula1's reward according sub stakes ratio:
     # first sub stake is 2/3 of entire stake and second sub stake is 1/3
     re_stake_for_second_sub_stake = ursula_reward // 3
     re_stake_for_first_sub_stake = ursula_reward - re_stake_for_second_sub_stake
     # Check re-stake for Ursula1's sub stakes
-    assert stake + ursula_reward == escrow.functions.getLockedTokens(ursula, 0).call()
-    assert sub_stake_1 + re_stake_for_first_sub_stake == escrow.functions.getSubStakeInfo(ursula, 0).call()[3]
-    assert sub_stake_2 + re_stake_for_second_sub_stake == escrow.functions.getSubStakeInfo(ursula, 1).call()[3]
+    assert stake + ursula_reward == escrow_functions.getLockedTokens(ursula, 0).call()
+    assert sub_stake_1 + re_stake_for_first_sub_stake == escrow_functions.getSubStakeInfo(ursula, 0).call()[3]
+    assert sub_stake_2 + re_stake_for_second_sub_stake == escrow_functions.getSubStakeInfo(ursula, 1).call()[3]
 
     # Ursula2's reward for both confirmed periods will be equal because of equal stakes for this periods
     # Also this reward will be equal to Ursula1's reward for the first period
     # Because re-stake affects only the second confirmed period
     reward_for_first_period = ursula2_reward // 2
     # Check re-stake for global `lockedPerPeriod` values
-    assert 2 * stake == escrow.functions.lockedPerPeriod(period - 2).call()
-    assert 2 * stake + reward_for_first_period == escrow.functions.lockedPerPeriod(period - 1).call()
-    assert 0 == escrow.functions.lockedPerPeriod(period).call()
+    assert 2 * stake == escrow_functions.lockedPerPeriod(period - 2).call()
+    assert 2 * stake + reward_for_first_period == escrow_functions.lockedPerPeriod(period - 1).call()
+    assert 0 == escrow_functions.lockedPerPeriod(period).call()
 
     # Can't turn off re-stake parameter during one more period
     with pytest.raises((TransactionFailed, ValueError)):
-        tx = escrow.functions.setReStake(False).transact({'from': ursula})
+        tx = escrow_functions.setReStake(False).transact({'from': ursula})
         testerchain.wait_for_receipt(tx)
 
     # Confirm activity and try to mine without re-stake
-    tx = escrow.functions.confirmActivity().transact({'from': ursula})
+    tx = escrow_functions.confirmActivity().transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
     testerchain.time_travel(hours=1)
 
     # Now turn off re-stake
-    tx = escrow.functions.setReStake(False).transact({'from': ursula})
+    tx = escrow_functions.setReStake(False).transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
-    assert not escrow.functions.stakerInfo(ursula).call()[RE_STAKE_FIELD]
+    assert not escrow_functions.stakerInfo(ursula).call()[RE_STAKE_FIELD]
 
     events = re_stake_log.get_all_entries()
     assert 4 == len(events)
@@ -445,31 +446,38 @@ def test_re_stake(testerchain, token, escrow_contract):
 
     # Check before mining
     testerchain.time_travel(hours=1)
-    period = escrow.functions.getCurrentPeriod().call()
-    sub_stake = escrow.functions.getLockedTokensInPast(ursula, 1).call()
-    assert sub_stake == escrow.functions.getLockedTokens(ursula, 0).call()
-    assert sub_stake == escrow.functions.getAllTokens(ursula).call()
-    assert sub_stake == escrow.functions.lockedPerPeriod(period - 1).call()
-    tx = escrow.functions.mint().transact({'from': ursula})
+    period = escrow_functions.getCurrentPeriod().call()
+    sub_stake = escrow_functions.getLockedTokensInPast(ursula, 1).call()
+    assert sub_stake == escrow_functions.getLockedTokens(ursula, 0).call()
+    assert sub_stake == escrow_functions.getAllTokens(ursula).call()
+    assert sub_stake == escrow_functions.lockedPerPeriod(period - 1).call()
+    tx = escrow_functions.mint().transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
 
     # Reward is not locked and stake is not changed
-    assert sub_stake < escrow.functions.getAllTokens(ursula).call()
-    assert sub_stake == escrow.functions.getLockedTokensInPast(ursula, 1).call()
-    assert sub_stake == escrow.functions.getLockedTokens(ursula, 0).call()
-    assert sub_stake == escrow.functions.lockedPerPeriod(period - 1).call()
+    assert sub_stake < escrow_functions.getAllTokens(ursula).call()
+    assert sub_stake == escrow_functions.getLockedTokensInPast(ursula, 1).call()
+    assert sub_stake == escrow_functions.getLockedTokens(ursula, 0).call()
+    assert sub_stake == escrow_functions.lockedPerPeriod(period - 1).call()
 
 
 @pytest.mark.slow
 def test_worker(testerchain, token, escrow_contract, deploy_contract):
     escrow = escrow_contract(10000)
+    escrow_functions = escrow.functions
     creator, ursula1, ursula2, ursula3, worker1, worker2, worker3, *everyone_else = \
         testerchain.client.accounts
 
     worker_log = escrow.events.WorkerSet.createFilter(fromBlock='latest')
 
+    def worker_mapping(staker, worker):
+        # Check both directions of the staker <-> worker mapping in one
+        # comparison so a failure reports the whole pair
+        return {'worker': escrow_functions.getWorkerFromStaker(staker).call(),
+                'staker': escrow_functions.getStakerFromWorker(worker).call()}
+
     # Initialize escrow contract
-    tx = escrow.functions.initialize().transact({'from': creator})
+    tx = escrow_functions.initialize().transact({'from': creator})
     testerchain.wait_for_receipt(tx)
 
     # Deploy intermediary contracts
@@ -484,26 +492,26 @@ def test_worker(testerchain, token, escrow_contract, deploy_contract):
     testerchain.wait_for_receipt(tx)
     tx = intermediary1.functions.deposit(sub_stake, duration).transact({'from': ursula1})
     testerchain.wait_for_receipt(tx)
-    assert sub_stake == escrow.functions.getAllTokens(intermediary1.address).call()
-    assert BlockchainInterface.NULL_ADDRESS == escrow.functions.getWorkerFromStaker(intermediary1.address).call()
-    assert BlockchainInterface.NULL_ADDRESS == escrow.functions.getStakerFromWorker(intermediary1.address).call()
+    assert sub_stake == escrow_functions.getAllTokens(intermediary1.address).call()
+    assert worker_mapping(intermediary1.address, intermediary1.address) == \
+        {'worker': BlockchainInterface.NULL_ADDRESS, 'staker': BlockchainInterface.NULL_ADDRESS}
 
     tx = token.functions.transfer(intermediary2.address, sub_stake).transact()
     testerchain.wait_for_receipt(tx)
     tx = intermediary2.functions.deposit(sub_stake, duration).transact({'from': ursula2})
     testerchain.wait_for_receipt(tx)
-    assert sub_stake == escrow.functions.getAllTokens(intermediary2.address).call()
-    assert BlockchainInterface.NULL_ADDRESS == escrow.functions.getWorkerFromStaker(intermediary2.address).call()
-    assert BlockchainInterface.NULL_ADDRESS == escrow.functions.getStakerFromWorker(intermediary2.address).call()
+    assert sub_stake == escrow_functions.getAllTokens(intermediary2.address).call()
+    assert worker_mapping(intermediary2.address, intermediary2.address) == \
+        {'worker': BlockchainInterface.NULL_ADDRESS, 'staker': BlockchainInterface.NULL_ADDRESS}
 
     tx = token.functions.transfer(ursula3, sub_stake).transact()
     testerchain.wait_for_receipt(tx)
     tx = token.functions.approveAndCall(escrow.address, sub_stake, testerchain.w3.toBytes(duration)) \
         .transact({'from': ursula3})
     testerchain.wait_for_receipt(tx)
-    assert sub_stake == escrow.functions.getAllTokens(ursula3).call()
-    assert BlockchainInterface.NULL_ADDRESS == escrow.functions.getWorkerFromStaker(ursula3).call()
-    assert BlockchainInterface.NULL_ADDRESS == escrow.functions.getStakerFromWorker(ursula3).call()
+    assert sub_stake == escrow_functions.getAllTokens(ursula3).call()
+    assert worker_mapping(ursula3, ursula3) == \
+        {'worker': BlockchainInterface.NULL_ADDRESS, 'staker': BlockchainInterface.NULL_ADDRESS}
 
     # Ursula can't confirm activity because there is no worker by default
     with pytest.raises((TransactionFailed, ValueError)):
@@ -518,18 +526,17 @@ def test_worker(testerchain, token, escrow_contract, deploy_contract):
     # Ursula set worker and now worker can confirm activity
     tx = intermediary1.functions.setWorker(worker1).transact({'from': ursula1})
     testerchain.wait_for_receipt(tx)
-    assert worker1 == escrow.functions.getWorkerFromStaker(intermediary1.address).call()
-    assert intermediary1.address == escrow.functions.getStakerFromWorker(worker1).call()
-    tx = escrow.functions.confirmActivity().transact({'from': worker1})
+    assert worker_mapping(intermediary1.address, worker1) == {'worker': worker1, 'staker': intermediary1.address}
+    tx = escrow_functions.confirmActivity().transact({'from': worker1})
     testerchain.wait_for_receipt(tx)
 
-    number_of_events = 1
-    events = worker_log.get_all_entries()
-    assert number_of_events == len(events)
+    # Poll only the delta since the last check instead of re-decoding history
+    events = worker_log.get_new_entries()
+    assert 1 == len(events)
     event_args = events[-1]['args']
     assert intermediary1.address == event_args['staker']
     assert worker1 == event_args['worker']
-    assert escrow.functions.getCurrentPeriod().call() == event_args['startPeriod']
+    assert escrow_functions.getCurrentPeriod().call() == event_args['startPeriod']
 
     # Only worker can confirm activity
     with pytest.raises((TransactionFailed, ValueError)):
@@ -562,54 +569,49 @@ def test_worker(testerchain, token, escrow_contract, deploy_contract):
     testerchain.time_travel(hours=1)
     tx = intermediary1.functions.setWorker(BlockchainInterface.NULL_ADDRESS).transact({'from': ursula1})
     testerchain.wait_for_receipt(tx)
-    assert BlockchainInterface.NULL_ADDRESS == escrow.functions.getWorkerFromStaker(intermediary1.address).call()
+    assert BlockchainInterface.NULL_ADDRESS == escrow_functions.getWorkerFromStaker(intermediary1.address).call()
 
-    number_of_events += 1
-    events = worker_log.get_all_entries()
-    assert number_of_events == len(events)
+    events = worker_log.get_new_entries()
+    assert 1 == len(events)
     event_args = events[-1]['args']
     assert intermediary1.address == event_args['staker']
     # Now the worker has been unset ...
     assert BlockchainInterface.NULL_ADDRESS == event_args['worker']
     # ... with a new starting period.
-    assert escrow.functions.getCurrentPeriod().call() == event_args['startPeriod']
+    assert escrow_functions.getCurrentPeriod().call() == event_args['startPeriod']
 
     # The staker can set now a new worker, without waiting additional time.
     tx = intermediary1.functions.setWorker(worker2).transact({'from': ursula1})
     testerchain.wait_for_receipt(tx)
-    assert worker2 == escrow.functions.getWorkerFromStaker(intermediary1.address).call()
-    assert intermediary1.address == escrow.functions.getStakerFromWorker(worker2).call()
-    assert BlockchainInterface.NULL_ADDRESS == escrow.functions.getStakerFromWorker(worker1).call()
+    assert worker_mapping(intermediary1.address, worker2) == {'worker': worker2, 'staker': intermediary1.address}
+    assert BlockchainInterface.NULL_ADDRESS == escrow_functions.getStakerFromWorker(worker1).call()
 
-    number_of_events += 1
-    events = worker_log.get_all_entries()
-    assert number_of_events == len(events)
+    events = worker_log.get_new_entries()
+    assert 1 == len(events)
     event_args = events[-1]['args']
     assert intermediary1.address == event_args['staker']
     assert worker2 == event_args['worker']
-    assert escrow.functions.getCurrentPeriod().call() == event_args['startPeriod']
+    assert escrow_functions.getCurrentPeriod().call() == event_args['startPeriod']
 
     # Now the previous worker can no longer confirm
     with pytest.raises((TransactionFailed, ValueError)):
-        tx = escrow.functions.confirmActivity().transact({'from': worker1})
+        tx = escrow_functions.confirmActivity().transact({'from': worker1})
         testerchain.wait_for_receipt(tx)
     # Only new worker can
-    tx = escrow.functions.confirmActivity().transact({'from': worker2})
+    tx = escrow_functions.confirmActivity().transact({'from': worker2})
     testerchain.wait_for_receipt(tx)
 
     # Another staker can use a free worker
     tx = intermediary2.functions.setWorker(worker1).transact({'from': ursula2})
     testerchain.wait_for_receipt(tx)
-    assert worker1 == escrow.functions.getWorkerFromStaker(intermediary2.address).call()
-    assert intermediary2.address == escrow.functions.getStakerFromWorker(worker1).call()
+    assert worker_mapping(intermediary2.address, worker1) == {'worker': worker1, 'staker': intermediary2.address}
 
-    number_of_events += 1
-    events = worker_log.get_all_entries()
-    assert number_of_events == len(events)
+    events = worker_log.get_new_entries()
+    assert 1 == len(events)
     event_args = events[-1]['args']
     assert intermediary2.address == event_args['staker']
     assert worker1 == event_args['worker']
-    assert escrow.functions.getCurrentPeriod().call() == event_args['startPeriod']
+    assert escrow_functions.getCurrentPeriod().call() == event_args['startPeriod']
 
     # The first worker still can't be a staker
     with pytest.raises((TransactionFailed, ValueError)):
@@ -621,25 +623,23 @@ def test_worker(testerchain, token, escrow_contract, deploy_contract):
     testerchain.time_travel(hours=1)
     tx = intermediary2.functions.setWorker(ursula2).transact({'from': ursula2})
     testerchain.wait_for_receipt(tx)
-    assert ursula2 == escrow.functions.getWorkerFromStaker(intermediary2.address).call()
-    assert intermediary2.address == escrow.functions.getStakerFromWorker(ursula2).call()
-    assert BlockchainInterface.NULL_ADDRESS == escrow.functions.getStakerFromWorker(worker1).call()
+    assert worker_mapping(intermediary2.address, ursula2) == {'worker': ursula2, 'staker': intermediary2.address}
+    assert BlockchainInterface.NULL_ADDRESS == escrow_functions.getStakerFromWorker(worker1).call()
 
-    number_of_events += 1
-    events = worker_log.get_all_entries()
-    assert number_of_events == len(events)
+    events = worker_log.get_new_entries()
+    assert 1 == len(events)
     event_args = events[-1]['args']
     assert intermediary2.address == event_args['staker']
     assert ursula2 == event_args['worker']
-    assert escrow.functions.getCurrentPeriod().call() == event_args['startPeriod']
+    assert escrow_functions.getCurrentPeriod().call() == event_args['startPeriod']
 
     # The first worker is free and can deposit tokens and become a staker
     tx = token.functions.approveAndCall(escrow.address, sub_stake, testerchain.w3.toBytes(duration)) \
         .transact({'from': worker1})
     testerchain.wait_for_receipt(tx)
-    assert sub_stake == escrow.functions.getAllTokens(worker1).call()
-    assert BlockchainInterface.NULL_ADDRESS == escrow.functions.getStakerFromWorker(worker1).call()
-    assert BlockchainInterface.NULL_ADDRESS == escrow.functions.getWorkerFromStaker(worker1).call()
+    assert sub_stake == escrow_functions.getAllTokens(worker1).call()
+    assert worker_mapping(worker1, worker1) == \
+        {'worker': BlockchainInterface.NULL_ADDRESS, 'staker': BlockchainInterface.NULL_ADDRESS}
 
     # Ursula can't use the first worker again because worker is a staker now
     testerchain.time_travel(hours=1)
@@ -649,53 +649,48 @@ def test_worker(testerchain, token, escrow_contract, deploy_contract):
 
     # Ursula without intermediary contract can set itself as worker
     # (Probably not her best idea, but whatever)
-    tx = escrow.functions.setWorker(ursula3).transact({'from': ursula3})
+    tx = escrow_functions.setWorker(ursula3).transact({'from': ursula3})
     testerchain.wait_for_receipt(tx)
-    assert ursula3 == escrow.functions.getStakerFromWorker(ursula3).call()
-    assert ursula3 == escrow.functions.getWorkerFromStaker(ursula3).call()
+    assert worker_mapping(ursula3, ursula3) == {'worker': ursula3, 'staker': ursula3}
 
-    number_of_events += 1
-    events = worker_log.get_all_entries()
-    assert number_of_events == len(events)
+    events = worker_log.get_new_entries()
+    assert 1 == len(events)
     event_args = events[-1]['args']
     assert ursula3 == event_args['staker']
     assert ursula3 == event_args['worker']
-    assert escrow.functions.getCurrentPeriod().call() == event_args['startPeriod']
+    assert escrow_functions.getCurrentPeriod().call() == event_args['startPeriod']
 
     # Now Ursula can confirm activity
-    tx = escrow.functions.confirmActivity().transact({'from': ursula3})
+    tx = escrow_functions.confirmActivity().transact({'from': ursula3})
     testerchain.wait_for_receipt(tx)
 
     # Ursula set worker again
     testerchain.time_travel(hours=1)
-    tx = escrow.functions.setWorker(worker3).transact({'from': ursula3})
+    tx = escrow_functions.setWorker(worker3).transact({'from': ursula3})
     testerchain.wait_for_receipt(tx)
-    assert ursula3 == escrow.functions.getStakerFromWorker(worker3).call()
-    assert worker3 == escrow.functions.getWorkerFromStaker(ursula3).call()
+    assert worker_mapping(ursula3, worker3) == {'worker': worker3, 'staker': ursula3}
 
-    number_of_events += 1
-    events = worker_log.get_all_entries()
-    assert number_of_events == len(events)
+    events = worker_log.get_new_entries()
+    assert 1 == len(events)
     event_args = events[-1]['args']
     assert ursula3 == event_args['staker']
     assert worker3 == event_args['worker']
-    assert escrow.functions.getCurrentPeriod().call() == event_args['startPeriod']
+    assert escrow_functions.getCurrentPeriod().call() == event_args['startPeriod']
 
-    tx = escrow.functions.confirmActivity().transact({'from': worker3})
+    tx = escrow_functions.confirmActivity().transact({'from': worker3})
     testerchain.wait_for_receipt(tx)
 
     # Ursula try to set contract as worker
     testerchain.time_travel(hours=1)
-    tx = escrow.functions.setWorker(intermediary3.address).transact({'from': ursula3})
+    tx = escrow_functions.setWorker(intermediary3.address).transact({'from': ursula3})
     testerchain.wait_for_receipt(tx)
 
-    number_of_events += 1
-    events = worker_log.get_all_entries()
-    assert number_of_events == len(events)
+    events = worker_log.get_new_entries()
+    assert 1 == len(events)
     event_args = events[-1]['args']
     assert ursula3 == event_args['staker']
     assert intermediary3.address == event_args['worker']
-    assert escrow.functions.getCurrentPeriod().call() == event_args['startPeriod']
+    assert escrow_functions.getCurrentPeriod().call() == event_args['startPeriod']
 
     # But can't confirm activity using an intermediary contract
     with pytest.raises((TransactionFailed, ValueError)):
@@ -706,18 +701,19 @@ def test_worker(testerchain, token, escrow_contract, deploy_contract):
 @pytest.mark.slow
 def test_measure_work(testerchain, token, escrow_contract, deploy_contract):
     escrow = escrow_contract(10000)
+    escrow_functions = escrow.functions
     creator, ursula, *everyone_else = testerchain.w3.eth.accounts
     work_measurement_log = escrow.events.WorkMeasurementSet.createFilter(fromBlock='latest')
 
     # Initialize escrow contract
     tx = token.functions.transfer(escrow.address, int(NU(10 ** 9, 'NuNit'))).transact({'from': creator})
     testerchain.wait_for_receipt(tx)
-    tx = escrow.functions.initialize().transact({'from': creator})
+    tx = escrow_functions.initialize().transact({'from': creator})
     testerchain.wait_for_receipt(tx)
 
     # Deploy WorkLock mock
     worklock, _ = deploy_contract('WorkLockForStakingEscrowMock', escrow.address)
-    tx = escrow.functions.setWorkLock(worklock.address).transact()
+    tx = escrow_functions.setWorkLock(worklock.address).transact()
     testerchain.wait_for_receipt(tx)
 
     # Prepare Ursula
@@ -727,23 +723,24 @@ def test_measure_work(testerchain, token, escrow_contract, deploy_contract):
     testerchain.wait_for_receipt(tx)
     tx = token.functions.approve(escrow.address, stake).transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
-    tx = escrow.functions.deposit(stake, duration).transact({'from': ursula})
+    tx = escrow_functions.deposit(stake, duration).transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
-    tx = escrow.functions.setWorker(ursula).transact({'from': ursula})
+    tx = escrow_functions.setWorker(ursula).transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
-    assert escrow.functions.getCompletedWork(ursula).call() == 0
+    assert escrow_functions.getCompletedWork(ursula).call() == 0
 
     # Confirm activity and mint to check that work is not measured by default
-    tx = escrow.functions.confirmActivity().transact({'from': ursula})
+    tx = escrow_functions.confirmActivity().transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
     testerchain.time_travel(hours=2)
-    tx = escrow.functions.mint().transact({'from': ursula})
+    tx = escrow_functions.mint().transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
-    assert escrow.functions.getAllTokens(ursula).call() > stake
-    assert escrow.functions.getCompletedWork(ursula).call() == 0
+    new_stake = escrow_functions.getAllTokens(ursula).call()
+    assert new_stake > stake
+    assert escrow_functions.getCompletedWork(ursula).call() == 0
+    stake = new_stake
 
     # Start work measurement
-    stake = escrow.functions.getAllTokens(ursula).call()
     tx = worklock.functions.setWorkMeasurement(ursula, True).transact()
     testerchain.wait_for_receipt(tx)
 
@@ -753,30 +750,33 @@ def test_measure_work(testerchain, token, escrow_contract, deploy_contract):
     assert ursula == event_args['staker']
     assert event_args['measureWork']
 
-    tx = escrow.functions.confirmActivity().transact({'from': ursula})
+    tx = escrow_functions.confirmActivity().transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
     testerchain.time_travel(hours=2)
-    tx = escrow.functions.mint().transact({'from': ursula})
+    tx = escrow_functions.mint().transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
-    reward = escrow.functions.getAllTokens(ursula).call() - stake
+    balance = escrow_functions.getAllTokens(ursula).call()
+    reward = balance - stake
     assert reward > 0
-    assert escrow.functions.getCompletedWork(ursula).call() == reward
+    work_done = escrow_functions.getCompletedWork(ursula).call()
+    assert work_done == reward
 
     # Mint again and check work done
-    stake = escrow.functions.getAllTokens(ursula).call()
-    work_done = escrow.functions.getCompletedWork(ursula).call()
-    tx = escrow.functions.confirmActivity().transact({'from': ursula})
+    stake = balance
+    tx = escrow_functions.confirmActivity().transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
     testerchain.time_travel(hours=2)
-    tx = escrow.functions.mint().transact({'from': ursula})
+    tx = escrow_functions.mint().transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
-    reward = escrow.functions.getAllTokens(ursula).call() - stake
+    balance = escrow_functions.getAllTokens(ursula).call()
+    reward = balance - stake
     assert reward > 0
-    assert escrow.functions.getCompletedWork(ursula).call() == work_done + reward
+    new_work_done = escrow_functions.getCompletedWork(ursula).call()
+    assert new_work_done == work_done + reward
 
     # Stop work measurement
-    stake = escrow.functions.getAllTokens(ursula).call()
-    work_done = escrow.functions.getCompletedWork(ursula).call()
+    stake = balance
+    work_done = new_work_done
     tx = worklock.functions.setWorkMeasurement(ursula, False).transact()
     testerchain.wait_for_receipt(tx)
 
@@ -786,12 +786,12 @@ def test_measure_work(testerchain, token, escrow_contract, deploy_contract):
     assert ursula == event_args['staker']
     assert not event_args['measureWork']
 
-    tx = escrow.functions.confirmActivity().transact({'from': ursula})
+    tx = escrow_functions.confirmActivity().transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
     testerchain.time_travel(hours=2)
-    tx = escrow.functions.mint().transact({'from': ursula})
+    tx = escrow_functions.mint().transact({'from': ursula})
     testerchain.wait_for_receipt(tx)
-    reward = escrow.functions.getAllTokens(ursula).call() - stake
+    reward = escrow_functions.getAllTokens(ursula).call() - stake
     assert reward > 0
-    assert escrow.functions.getCompletedWork(ursula).call() == work_done
+    assert escrow_functions.getCompletedWork(ursula).call() == work_done
 
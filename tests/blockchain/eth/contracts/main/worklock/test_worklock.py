@@ -17,15 +17,29 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 
 import pytest
 from eth_tester.exceptions import TransactionFailed
+from web3 import Web3
 
+# Log topics computed once at module load instead of on every query
+BID_TOPIC = Web3.keccak(text='Bid(address,uint256,uint256)').hex()
+CLAIMED_TOPIC = Web3.keccak(text='Claimed(address,uint256)').hex()
+REFUND_TOPIC = Web3.keccak(text='Refund(address,uint256,uint256)').hex()
 
-@pytest.fixture()
+
+def get_topic_logs(event, topic, from_block):
+    """Queries the precomputed topic directly to skip per-call filter construction"""
+    logs = event.web3.eth.getLogs({'address': event.address,
+                                   'topics': [topic],
+                                   'fromBlock': from_block})
+    return [event().processLog(log) for log in logs]
+
+
+@pytest.fixture(scope='module')
 def token(testerchain, token_economics, deploy_contract):
     contract, _ = deploy_contract('NuCypherToken', _totalSupply=token_economics.erc20_total_supply)
     return contract
 
 
-@pytest.fixture()
+@pytest.fixture(scope='module')
 def escrow(testerchain, token_economics, deploy_contract, token):
     contract, _ = deploy_contract(
         contract_name='StakingEscrowForWorkLockMock',
@@ -40,6 +54,8 @@ def escrow(testerchain, token_economics, deploy_contract, token):
 @pytest.mark.slow
 def test_worklock(testerchain, token_economics, deploy_contract, token, escrow):
     creator, ursula1, ursula2, *everyone_else = testerchain.w3.eth.accounts
+    minimum_allowed_locked = token_economics.minimum_allowed_locked
+    maximum_allowed_locked = token_economics.maximum_allowed_locked
 
     # Deploy WorkLock
     now = testerchain.w3.eth.getBlock(block_identifier='latest').timestamp
@@ -59,23 +75,25 @@ def test_worklock(testerchain, token_economics, deploy_contract, token, escrow):
     )
     assert worklock.functions.startBidDate().call() == start_bid_date
     assert worklock.functions.endBidDate().call() == end_bid_date
-    assert worklock.functions.minAllowableLockedTokens().call() == token_economics.minimum_allowed_locked
-    assert worklock.functions.maxAllowableLockedTokens().call() == token_economics.maximum_allowed_locked
+    assert worklock.functions.minAllowableLockedTokens().call() == minimum_allowed_locked
+    assert worklock.functions.maxAllowableLockedTokens().call() == maximum_allowed_locked
     assert worklock.functions.depositRate().call() == deposit_rate
     assert worklock.functions.refundRate().call() == refund_rate
 
-    bidding_log = worklock.events.Bid.createFilter(fromBlock='latest')
-    claim_log = worklock.events.Claimed.createFilter(fromBlock='latest')
-    refund_log = worklock.events.Refund.createFilter(fromBlock='latest')
+    # Remember the deploy point and query logs directly instead of
+    # installing filters: one eth_getLogs call per check, no filter state
+    start_block = testerchain.w3.eth.blockNumber
 
     # Transfer tokens to WorkLock
-    worklock_supply = 2 * token_economics.maximum_allowed_locked - 1
+    worklock_supply = 2 * maximum_allowed_locked - 1
     tx = token.functions.transfer(worklock.address, worklock_supply).transact({'from': creator})
     testerchain.wait_for_receipt(tx)
 
     # Give Ursulas some ETH
-    minimum_deposit_eth = token_economics.minimum_allowed_locked // deposit_rate
-    maximum_deposit_eth = token_economics.maximum_allowed_locked // deposit_rate
+    minimum_deposit_eth = minimum_allowed_locked // deposit_rate
+    maximum_deposit_eth = maximum_allowed_locked // deposit_rate
+    # Work required to unlock the minimum bid; reused by the refund checks below
+    work_per_minimum_bid = minimum_deposit_eth * refund_rate
     ursula1_balance = 2 * maximum_deposit_eth
     tx = testerchain.w3.eth.sendTransaction(
         {'from': testerchain.etherbase_account, 'to': ursula1, 'value': ursula1_balance})
@@ -86,26 +104,21 @@ def test_worklock(testerchain, token_economics, deploy_contract, token, escrow):
     testerchain.wait_for_receipt(tx)
 
     # Can't do anything before start date
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = worklock.functions.bid().transact({'from': ursula1, 'value': minimum_deposit_eth, 'gas_price': 0})
-        testerchain.wait_for_receipt(tx)
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = worklock.functions.claim().transact({'from': ursula1, 'gas_price': 0})
-        testerchain.wait_for_receipt(tx)
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = worklock.functions.refund().transact({'from': ursula1, 'gas_price': 0})
-        testerchain.wait_for_receipt(tx)
+    with pytest.raises(TransactionFailed):
+        worklock.functions.bid().call({'from': ursula1, 'value': minimum_deposit_eth})
+    with pytest.raises(TransactionFailed):
+        worklock.functions.claim().call({'from': ursula1})
+    with pytest.raises(TransactionFailed):
+        worklock.functions.refund().call({'from': ursula1})
 
     # Wait for the start of bidding
     testerchain.time_travel(seconds=3600)  # Wait exactly 1 hour
 
     # Can't bid with too low or too high ETH
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = worklock.functions.bid().transact({'from': ursula1, 'value': minimum_deposit_eth - 1, 'gas_price': 0})
-        testerchain.wait_for_receipt(tx)
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = worklock.functions.bid().transact({'from': ursula1, 'value': maximum_deposit_eth + 1, 'gas_price': 0})
-        testerchain.wait_for_receipt(tx)
+    with pytest.raises(TransactionFailed):
+        worklock.functions.bid().call({'from': ursula1, 'value': minimum_deposit_eth - 1})
+    with pytest.raises(TransactionFailed):
+        worklock.functions.bid().call({'from': ursula1, 'value': maximum_deposit_eth + 1})
 
     # Ursula does first bid
     assert worklock.functions.allClaimedTokens().call() == 0
@@ -113,83 +126,74 @@ def test_worklock(testerchain, token_economics, deploy_contract, token, escrow):
     assert testerchain.w3.eth.getBalance(worklock.address) == 0
     tx = worklock.functions.bid().transact({'from': ursula1, 'value': minimum_deposit_eth, 'gas_price': 0})
     testerchain.wait_for_receipt(tx)
-    assert worklock.functions.allClaimedTokens().call() == token_economics.minimum_allowed_locked
+    assert worklock.functions.allClaimedTokens().call() == minimum_allowed_locked
     assert worklock.functions.workInfo(ursula1).call()[0] == minimum_deposit_eth
     assert testerchain.w3.eth.getBalance(worklock.address) == minimum_deposit_eth
 
-    events = bidding_log.get_all_entries()
+    events = get_topic_logs(worklock.events.Bid, BID_TOPIC, start_block)
     assert 1 == len(events)
     event_args = events[0]['args']
     assert event_args['staker'] == ursula1
     assert event_args['depositedETH'] == minimum_deposit_eth
-    assert event_args['claimedTokens'] == token_economics.minimum_allowed_locked
+    assert event_args['claimedTokens'] == minimum_allowed_locked
 
     # Second Ursula does first bid
     assert worklock.functions.workInfo(ursula2).call()[0] == 0
     tx = worklock.functions.bid().transact({'from': ursula2, 'value': maximum_deposit_eth, 'gas_price': 0})
     testerchain.wait_for_receipt(tx)
     assert worklock.functions.allClaimedTokens().call() == \
-           token_economics.minimum_allowed_locked + token_economics.maximum_allowed_locked
+           minimum_allowed_locked + maximum_allowed_locked
     assert worklock.functions.workInfo(ursula2).call()[0] == maximum_deposit_eth
     assert testerchain.w3.eth.getBalance(worklock.address) == maximum_deposit_eth + minimum_deposit_eth
 
-    events = bidding_log.get_all_entries()
+    events = get_topic_logs(worklock.events.Bid, BID_TOPIC, start_block)
     assert 2 == len(events)
     event_args = events[1]['args']
     assert event_args['staker'] == ursula2
     assert event_args['depositedETH'] == maximum_deposit_eth
-    assert event_args['claimedTokens'] == token_economics.maximum_allowed_locked
+    assert event_args['claimedTokens'] == maximum_allowed_locked
 
     # Can't bid again with too high ETH
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = worklock.functions.bid().transact(
-            {'from': ursula1, 'value': maximum_deposit_eth-minimum_deposit_eth+1, 'gas_price': 0})
-        testerchain.wait_for_receipt(tx)
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = worklock.functions.bid().transact({'from': ursula2, 'value': 1, 'gas_price': 0})
-        testerchain.wait_for_receipt(tx)
+    with pytest.raises(TransactionFailed):
+        worklock.functions.bid().call({'from': ursula1, 'value': maximum_deposit_eth-minimum_deposit_eth+1})
+    with pytest.raises(TransactionFailed):
+        worklock.functions.bid().call({'from': ursula2, 'value': 1})
 
     # Ursula does second bid
     tx = worklock.functions.bid().transact({'from': ursula1, 'value': minimum_deposit_eth, 'gas_price': 0})
     testerchain.wait_for_receipt(tx)
     assert worklock.functions.allClaimedTokens().call() == \
-           2 * token_economics.minimum_allowed_locked + token_economics.maximum_allowed_locked
+           2 * minimum_allowed_locked + maximum_allowed_locked
     assert worklock.functions.workInfo(ursula1).call()[0] == 2 * minimum_deposit_eth
     assert testerchain.w3.eth.getBalance(worklock.address) == maximum_deposit_eth + 2 * minimum_deposit_eth
 
-    events = bidding_log.get_all_entries()
+    events = get_topic_logs(worklock.events.Bid, BID_TOPIC, start_block)
     assert 3 == len(events)
     event_args = events[2]['args']
     assert event_args['staker'] == ursula1
     assert event_args['depositedETH'] == minimum_deposit_eth
-    assert event_args['claimedTokens'] == token_economics.minimum_allowed_locked
+    assert event_args['claimedTokens'] == minimum_allowed_locked
 
     # Can't bid again: not enough tokens in worklock
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = worklock.functions.bid().transact(
-            {'from': ursula1, 'value': maximum_deposit_eth - 2 * minimum_deposit_eth, 'gas_price': 0})
-        testerchain.wait_for_receipt(tx)
+    with pytest.raises(TransactionFailed):
+        worklock.functions.bid().call({'from': ursula1, 'value': maximum_deposit_eth - 2 * minimum_deposit_eth})
 
     # Can't claim or refund while bidding phase
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = worklock.functions.claim().transact({'from': ursula1, 'gas_price': 0})
-        testerchain.wait_for_receipt(tx)
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = worklock.functions.refund().transact({'from': ursula1, 'gas_price': 0})
-        testerchain.wait_for_receipt(tx)
+    with pytest.raises(TransactionFailed):
+        worklock.functions.claim().call({'from': ursula1})
+    with pytest.raises(TransactionFailed):
+        worklock.functions.refund().call({'from': ursula1})
 
     # Wait for the end of bidding
     testerchain.time_travel(seconds=3600)  # Wait exactly 1 hour
 
     # Can't bid after the enf of bidding
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = worklock.functions.bid().transact({'from': ursula1, 'value': minimum_deposit_eth, 'gas_price': 0})
-        testerchain.wait_for_receipt(tx)
+    with pytest.raises(TransactionFailed):
+        worklock.functions.bid().call({'from': ursula1, 'value': minimum_deposit_eth})
 
     # Can't refund without claim
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = worklock.functions.refund().transact({'from': ursula1, 'gas_price': 0})
-        testerchain.wait_for_receipt(tx)
+    with pytest.raises(TransactionFailed):
+        worklock.functions.refund().call({'from': ursula1})
 
     # Ursula claims tokens
     value, measure_work, _completed_work, periods = escrow.functions.stakerInfo(ursula1).call()
@@ -198,30 +202,28 @@ def test_worklock(testerchain, token_economics, deploy_contract, token, escrow):
     assert periods == 0
     tx = worklock.functions.claim().transact({'from': ursula1, 'gas_price': 0})
     testerchain.wait_for_receipt(tx)
-    assert worklock.functions.getRemainingWork(ursula1).call() == 2 * minimum_deposit_eth * refund_rate
+    assert worklock.functions.getRemainingWork(ursula1).call() == 2 * work_per_minimum_bid
     value, measure_work, completed_work, periods = escrow.functions.stakerInfo(ursula1).call()
-    assert value == 2 * token_economics.minimum_allowed_locked
+    assert value == 2 * minimum_allowed_locked
     assert measure_work
     assert periods == 2 * token_economics.minimum_locked_periods
     assert token.functions.balanceOf(worklock.address).call() == \
-           worklock_supply - 2 * token_economics.minimum_allowed_locked
-    assert token.functions.balanceOf(escrow.address).call() == 2 * token_economics.minimum_allowed_locked
+           worklock_supply - 2 * minimum_allowed_locked
+    assert token.functions.balanceOf(escrow.address).call() == 2 * minimum_allowed_locked
 
-    events = claim_log.get_all_entries()
+    events = get_topic_logs(worklock.events.Claimed, CLAIMED_TOPIC, start_block)
     assert 1 == len(events)
     event_args = events[0]['args']
     assert event_args['staker'] == ursula1
-    assert event_args['claimedTokens'] == 2 * token_economics.minimum_allowed_locked
+    assert event_args['claimedTokens'] == 2 * minimum_allowed_locked
 
     # Can't claim more than once
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = worklock.functions.claim().transact({'from': ursula1, 'gas_price': 0})
-        testerchain.wait_for_receipt(tx)
+    with pytest.raises(TransactionFailed):
+        worklock.functions.claim().call({'from': ursula1})
 
     # Can't refund without work
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = worklock.functions.refund().transact({'from': ursula1, 'gas_price': 0})
-        testerchain.wait_for_receipt(tx)
+    with pytest.raises(TransactionFailed):
+        worklock.functions.refund().call({'from': ursula1})
 
     # Second Ursula claims tokens
     value, measure_work, _completed_work, periods = escrow.functions.stakerInfo(ursula2).call()
@@ -234,41 +236,41 @@ def test_worklock(testerchain, token_economics, deploy_contract, token, escrow):
     testerchain.wait_for_receipt(tx)
     assert worklock.functions.getRemainingWork(ursula2).call() == maximum_deposit_eth * refund_rate
     value, measure_work, completed_work, periods = escrow.functions.stakerInfo(ursula2).call()
-    assert value == token_economics.maximum_allowed_locked
+    assert value == maximum_allowed_locked
     assert measure_work
     assert periods == 2 * token_economics.minimum_locked_periods
     assert token.functions.balanceOf(worklock.address).call() == \
-           worklock_supply - 2 * token_economics.minimum_allowed_locked - token_economics.maximum_allowed_locked
+           worklock_supply - 2 * minimum_allowed_locked - maximum_allowed_locked
     assert token.functions.balanceOf(escrow.address).call() == \
-           2 * token_economics.minimum_allowed_locked + token_economics.maximum_allowed_locked
+           2 * minimum_allowed_locked + maximum_allowed_locked
 
-    events = claim_log.get_all_entries()
+    events = get_topic_logs(worklock.events.Claimed, CLAIMED_TOPIC, start_block)
     assert 2 == len(events)
     event_args = events[1]['args']
     assert event_args['staker'] == ursula2
-    assert event_args['claimedTokens'] == token_economics.maximum_allowed_locked
+    assert event_args['claimedTokens'] == maximum_allowed_locked
 
     # "Do" some work and partial refund
     ursula1_balance = testerchain.w3.eth.getBalance(ursula1)
     completed_work = refund_rate * minimum_deposit_eth + refund_rate // 2
     tx = escrow.functions.setCompletedWork(ursula1, completed_work).transact()
     testerchain.wait_for_receipt(tx)
-    assert worklock.functions.getRemainingWork(ursula1).call() == minimum_deposit_eth * refund_rate - refund_rate // 2
+    assert worklock.functions.getRemainingWork(ursula1).call() == work_per_minimum_bid - refund_rate // 2
     tx = worklock.functions.refund().transact({'from': ursula1, 'gas_price': 0})
     testerchain.wait_for_receipt(tx)
     assert worklock.functions.workInfo(ursula1).call()[0] == minimum_deposit_eth
-    assert worklock.functions.getRemainingWork(ursula1).call() == minimum_deposit_eth * refund_rate - refund_rate // 2
+    assert worklock.functions.getRemainingWork(ursula1).call() == work_per_minimum_bid - refund_rate // 2
     assert testerchain.w3.eth.getBalance(ursula1) == ursula1_balance + minimum_deposit_eth
     assert testerchain.w3.eth.getBalance(worklock.address) == maximum_deposit_eth + minimum_deposit_eth
     _value, measure_work, _completed_work, _periods = escrow.functions.stakerInfo(ursula1).call()
     assert measure_work
 
-    events = refund_log.get_all_entries()
+    events = get_topic_logs(worklock.events.Refund, REFUND_TOPIC, start_block)
     assert 1 == len(events)
     event_args = events[0]['args']
     assert event_args['staker'] == ursula1
     assert event_args['refundETH'] == minimum_deposit_eth
-    assert event_args['completedWork'] == minimum_deposit_eth * refund_rate
+    assert event_args['completedWork'] == work_per_minimum_bid
 
     # "Do" more work and full refund
     ursula1_balance = testerchain.w3.eth.getBalance(ursula1)
@@ -285,19 +287,18 @@ def test_worklock(testerchain, token_economics, deploy_contract, token, escrow):
     _value, measure_work, _completed_work, _periods = escrow.functions.stakerInfo(ursula1).call()
     assert not measure_work
 
-    events = refund_log.get_all_entries()
+    events = get_topic_logs(worklock.events.Refund, REFUND_TOPIC, start_block)
     assert 2 == len(events)
     event_args = events[1]['args']
     assert event_args['staker'] == ursula1
     assert event_args['refundETH'] == minimum_deposit_eth
-    assert event_args['completedWork'] == minimum_deposit_eth * refund_rate
+    assert event_args['completedWork'] == work_per_minimum_bid
 
     # Can't refund more tokens
     tx = escrow.functions.setCompletedWork(ursula1, 2 * completed_work).transact()
     testerchain.wait_for_receipt(tx)
-    with pytest.raises((TransactionFailed, ValueError)):
-        tx = worklock.functions.refund().transact({'from': ursula1, 'gas_price': 0})
-        testerchain.wait_for_receipt(tx)
+    with pytest.raises(TransactionFailed):
+        worklock.functions.refund().call({'from': ursula1})
 
 
 @pytest.mark.slow
@@ -318,7 +319,7 @@ def test_reentrancy(testerchain, token_economics, deploy_contract, token, escrow
         _refundRate=refund_rate,
         _lockedPeriods=2 * token_economics.minimum_locked_periods
     )
-    refund_log = worklock.events.Refund.createFilter(fromBlock='latest')
+    start_block = testerchain.w3.eth.blockNumber
     worklock_supply = 2 * token_economics.maximum_allowed_locked - 1
     tx = token.functions.transfer(worklock.address, worklock_supply).transact()
     testerchain.wait_for_receipt(tx)
@@ -362,4 +363,4 @@ def test_reentrancy(testerchain, token_economics, deploy_contract, token, escrow
     assert testerchain.w3.eth.getBalance(contract_address) == balance
     assert worklock.functions.workInfo(contract_address).call()[0] == minimum_deposit_eth
     assert worklock.functions.getRemainingWork(contract_address).call() == 2 * minimum_deposit_eth * refund_rate // 3
-    assert len(refund_log.get_all_entries()) == 0
+    assert len(get_topic_logs(worklock.events.Refund, REFUND_TOPIC, start_block)) == 0
@@ -120,6 +120,8 @@ def test_read_timestamp(agent):
 def test_deposit_and_withdraw_as_staker(testerchain, agent, agency, allocation_value, token_economics,
                                         mock_transacting_power_activation):
     token_agent, staking_agent, policy_agent = agency
+    minimum_allowed_locked = token_economics.minimum_allowed_locked
+    minimum_locked_periods = token_economics.minimum_locked_periods
 
     assert staking_agent.get_locked_tokens(staker_address=agent.contract_address) == 0
     assert staking_agent.get_locked_tokens(staker_address=agent.contract_address, periods=1) == 0
@@ -129,23 +131,23 @@ def test_deposit_and_withdraw_as_staker(testerchain, agent, agency, allocation_v
     mock_transacting_power_activation(account=agent.beneficiary, password=INSECURE_DEVELOPMENT_PASSWORD)
 
     # Move the tokens to the StakingEscrow
-    receipt = agent.deposit_as_staker(amount=token_economics.minimum_allowed_locked, lock_periods=token_economics.minimum_locked_periods)
+    receipt = agent.deposit_as_staker(amount=minimum_allowed_locked, lock_periods=minimum_locked_periods)
     assert receipt['status'] == 1, "Transaction Rejected"
 
     # Owner sets a worker in StakingEscrow via PreallocationEscrow
     worker = testerchain.ursula_account(0)
     _receipt = agent.set_worker(worker_address=worker)
 
-    assert token_agent.get_balance(address=agent.contract_address) == allocation_value - token_economics.minimum_allowed_locked
+    assert token_agent.get_balance(address=agent.contract_address) == allocation_value - minimum_allowed_locked
     assert agent.unvested_tokens == allocation_value
     assert staking_agent.get_locked_tokens(staker_address=agent.contract_address) == 0
-    assert staking_agent.get_locked_tokens(staker_address=agent.contract_address, periods=1) == token_economics.minimum_allowed_locked
-    assert staking_agent.get_locked_tokens(staker_address=agent.contract_address, periods=token_economics.minimum_locked_periods) == token_economics.minimum_allowed_locked
-    assert staking_agent.get_locked_tokens(staker_address=agent.contract_address, periods=token_economics.minimum_locked_periods+1) == 0
+    assert staking_agent.get_locked_tokens(staker_address=agent.contract_address, periods=1) == minimum_allowed_locked
+    assert staking_agent.get_locked_tokens(staker_address=agent.contract_address, periods=minimum_locked_periods) == minimum_allowed_locked
+    assert staking_agent.get_locked_tokens(staker_address=agent.contract_address, periods=minimum_locked_periods+1) == 0
 
     mock_transacting_power_activation(account=worker, password=INSECURE_DEVELOPMENT_PASSWORD)
 
-    for _ in range(token_economics.minimum_locked_periods):
+    for _ in range(minimum_locked_periods):
         staking_agent.confirm_activity(worker_address=worker)
         testerchain.time_travel(periods=1)
     testerchain.time_travel(periods=1)
@@ -154,8 +156,8 @@ def test_deposit_and_withdraw_as_staker(testerchain, agent, agency, allocation_v
     agent.mint()
 
     assert staking_agent.get_locked_tokens(staker_address=agent.contract_address) == 0
-    assert token_agent.get_balance(address=agent.contract_address) == allocation_value - token_economics.minimum_allowed_locked
-    receipt = agent.withdraw_as_staker(value=token_economics.minimum_allowed_locked)
+    assert token_agent.get_balance(address=agent.contract_address) == allocation_value - minimum_allowed_locked
+    receipt = agent.withdraw_as_staker(value=minimum_allowed_locked)
     assert receipt['status'] == 1, "Transaction Rejected"
     assert token_agent.get_balance(address=agent.contract_address) == allocation_value
 
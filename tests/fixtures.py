@@ -36,7 +36,6 @@ from web3 import Web3
 from nucypher.blockchain.economics import StandardTokenEconomics
 from nucypher.blockchain.eth.actors import Staker, StakeHolder
 from nucypher.blockchain.eth.agents import NucypherTokenAgent
-from nucypher.blockchain.eth.clients import NuCypherGethDevProcess
 from nucypher.blockchain.eth.deployers import (NucypherTokenDeployer,
                                                StakingEscrowDeployer,
                                                PolicyManagerDeployer,
@@ -44,7 +43,7 @@ from nucypher.blockchain.eth.deployers import (NucypherTokenDeployer,
                                                StakingInterfaceDeployer,
                                                PreallocationEscrowDeployer)
 from nucypher.blockchain.eth.interfaces import BlockchainInterfaceFactory
-from nucypher.blockchain.eth.registry import InMemoryContractRegistry, GithubRegistrySource
+from nucypher.blockchain.eth.registry import InMemoryContractRegistry
 from nucypher.blockchain.eth.sol.compile import SolidityCompiler
 from nucypher.blockchain.eth.token import NU
 from nucypher.characters.lawful import Enrico, Bob
@@ -427,6 +426,7 @@ def testerchain(_testerchain):
 
     coinbase, *addresses = testerchain.client.accounts
 
+    tx_hashes = list()
     for address in addresses:
         balance = testerchain.client.get_balance(address)
         spent = DEVELOPMENT_ETH_AIRDROP_AMOUNT - balance
@@ -435,9 +435,14 @@ def testerchain(_testerchain):
             tx = {'to': address, 'from': coinbase, 'value': spent}
             txhash = testerchain.w3.eth.sendTransaction(tx)
 
-            _receipt = testerchain.wait_for_receipt(txhash)
+            tx_hashes.append(txhash)
             eth_amount = Web3().fromWei(spent, 'ether')
             testerchain.log.info("Airdropped {} ETH {} -> {}".format(eth_amount, tx['from'], tx['to']))
+
+    # Transactions from the same sender are mined in order;
+    # one receipt wait covers the whole batch.
+    if tx_hashes:
+        _receipt = testerchain.wait_for_receipt(tx_hashes[-1])
     yield testerchain
 
 
@@ -675,6 +680,8 @@ def mock_ursula_reencrypts():
 
 @pytest.fixture(scope='session')
 def instant_geth_dev_node():
+    # Deferred import: only the geth-backed tests pay for loading the client machinery
+    from nucypher.blockchain.eth.clients import NuCypherGethDevProcess
     geth = NuCypherGethDevProcess()
     try:
         yield geth
@@ -829,6 +836,8 @@ def get_random_checksum_address():
 
 @pytest.fixture(scope='module')
 def _patch_individual_allocation_fetch_latest_publication(agency, test_registry):
+    # Deferred import: the registry source is only patched here
+    from nucypher.blockchain.eth.registry import GithubRegistrySource
     empty_allocation_escrow_deployer = PreallocationEscrowDeployer(registry=test_registry)
     allocation_contract_abi = empty_allocation_escrow_deployer.get_contract_abi()
     allocation_template = {